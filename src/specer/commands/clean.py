@@ -168,17 +168,15 @@ def clean_command(
         verbose=verbose,
     )
 
-    if dry_run:
-        typer.echo(f"Would execute: {' '.join(cmd)}")
-        # Clean up generated config file if in dry-run mode
+    try:
+        if dry_run:
+            typer.echo(f"Would execute: {' '.join(cmd)}")
+            return
+
+        # Execute the command
+        execute_runcpu(cmd, verbose=verbose)
+    finally:
+        # Clean up generated config file (after execution or in dry-run mode)
         if generated_config_path:
-            Path(generated_config_path).unlink()
-        return
-
-    # Execute the command
-    execute_runcpu(cmd, verbose=verbose)
-
-    # Clean up generated config file after execution
-    if generated_config_path:
-        with contextlib.suppress(OSError):
-            Path(generated_config_path).unlink()
+            with contextlib.suppress(OSError):
+                Path(generated_config_path).unlink()
@@ -1,6 +1,5 @@
 """Compile command for SPEC CPU 2017 benchmarks."""
 
-import re
 from pathlib import Path
 from typing import Annotated
 
@@ -13,6 +12,7 @@ from specer.utils import (
     detect_suite_preference,
     execute_runcpu,
     generate_config_from_template,
+    is_valid_cpu_list,
     validate_and_get_spec_root,
     validate_numa_topology,
 )
@@ -181,14 +181,12 @@ def compile_command(
         # Basic validation for CPU cores format
         if cpu_cores is not None:
             # Simple validation - more detailed validation would happen in numactl/taskset
-            if not cpu_cores.replace("-", "").replace(",", "").replace(" ", "").isdigit():
-                # Allow ranges and lists
-                if not re.match(r"^[\d\-,\s]+$", cpu_cores):
-                    typer.echo(
-                        "Error: Invalid CPU cores format. Use formats like '0-3', '0,2,4', or '0-3,8-11'",
-                        err=True,
-                    )
-                    raise typer.Exit(1)
+            if not is_valid_cpu_list(cpu_cores):
+                typer.echo(
+                    "Error: Invalid CPU cores format. Use formats like '0-3', '0,2,4', or '0-3,8-11'",
+                    err=True,
+                )
+                raise typer.Exit(1)
 
             if dry_run:
                 typer.echo(f"CPU cores binding: {cpu_cores}")
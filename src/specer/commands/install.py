@@ -10,6 +10,8 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
+from specer.utils import iter_output_lines
+
 
 def install_command(
     iso_path: Annotated[
@@ -454,32 +456,32 @@ def _run_installer_simple(
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             stdin=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
+            bufsize=0,
         )
 
-        # Stream output in real-time and automatically respond to prompts
-        while True:
-            if process.stdout is None:
-                break
-            output = process.stdout.readline()
-            if output == "" and process.poll() is not None:
-                break
-            if output:
-                # Print each line directly for real-time viewing
-                console.print(output.rstrip(), highlight=False)
-
-                # Check for the confirmation prompt and auto-respond
-                if "Is this correct? (Please enter 'yes' or 'no')" in output:
-                    try:
-                        console.print("[dim]Auto-responding: yes[/dim]")
-                        if process.stdin is not None:
-                            process.stdin.write("yes\n")
-                            process.stdin.flush()
-                    except (BrokenPipeError, OSError):
-                        # Process may have closed stdin
-                        pass
+        # Stream output in real-time and automatically respond to prompts; output is
+        # read as raw bytes in large chunks and decoded a batch of lines at a time
+        if process.stdout is not None:
+            for lines in iter_output_lines(process.stdout.fileno()):
+                pending: list[str] = []
+                for output in lines:
+                    pending.append(output)
+
+                    # Check for the confirmation prompt and auto-respond
+                    if "Is this correct? (Please enter 'yes' or 'no')" in output:
+                        console.print("\n".join(pending), highlight=False)
+                        pending.clear()
+                        try:
+                            console.print("[dim]Auto-responding: yes[/dim]")
+                            if process.stdin is not None:
+                                process.stdin.write(b"yes\n")
+                        except (BrokenPipeError, OSError):
+                            # Process may have closed stdin
+                            pass
+
+                if pending:
+                    # Print each read's worth of lines at once for real-time viewing
+                    console.print("\n".join(pending), highlight=False)
 
         # Wait for process to complete and get return code
         return_code = process.wait()
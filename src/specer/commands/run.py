@@ -1,18 +1,19 @@
 """Run command for SPEC CPU 2017 benchmarks."""
 
-import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
 from specer.logging import logger
 from specer.result_parser import read_result_file
-from specer.sync import create_evalsync_worker
+from specer.sync import SpecerEvalSyncWorker, create_evalsync_worker
 from specer.utils import (
+    RATE_SUITES,
+    SPEED_SUITES,
     build_affinity_command,
     build_runcpu_command,
     check_benchmarks_compiled,
@@ -21,11 +22,16 @@ from specer.utils import (
     display_results_with_rich,
     execute_runcpu,
     generate_config_from_template,
-    save_results_to_json,
+    get_console,
+    is_valid_cpu_list,
+    save_results_to_json_async,
     validate_and_get_spec_root,
     validate_numa_topology,
 )
 
+# Benchmark suites accepted by SPEC for reportable runs
+_REPORTABLE_SUITES: frozenset[str] = frozenset({"intspeed", "intrate", "fpspeed", "fprate", "all"})
+
 
 def run_command(
     benchmarks: Annotated[
@@ -186,6 +192,20 @@ def run_command(
             help="Save results to JSON file (auto-named if no path provided)",
         ),
     ] = None,
+    pretty_json: Annotated[
+        bool,
+        typer.Option(
+            "--pretty",
+            help="Indent the --json output for readability (compact by default)",
+        ),
+    ] = False,
+    config_sidecar: Annotated[
+        bool,
+        typer.Option(
+            "--config-sidecar",
+            help="Copy the config next to the --json output instead of embedding its contents",
+        ),
+    ] = False,
     output_formats: Annotated[
         str | None,
         typer.Option(
@@ -302,8 +322,7 @@ def run_command(
     # Validate reportable mode requirements
     if reportable:
         # SPEC reportable runs require full benchmark suites, not individual benchmarks
-        valid_suites = {"intspeed", "intrate", "fpspeed", "fprate", "all"}
-        if not any(bench.lower() in valid_suites for bench in benchmarks):
+        if frozenset(map(str.lower, benchmarks)).isdisjoint(_REPORTABLE_SUITES):
             typer.echo("Error: --reportable requires a full benchmark suite", err=True)
             typer.echo("", err=True)
             typer.echo("Valid suites for reportable runs:", err=True)
@@ -342,14 +361,12 @@ def run_command(
         # Basic validation for CPU cores format
         if cpu_cores is not None:
             # Simple validation - more detailed validation would happen in numactl/taskset
-            if not cpu_cores.replace("-", "").replace(",", "").replace(" ", "").isdigit():
-                # Allow ranges and lists
-                if not re.match(r"^[\d\-,\s]+$", cpu_cores):
-                    typer.echo(
-                        "Error: Invalid CPU cores format. Use formats like '0-3', '0,2,4', or '0-3,8-11'",
-                        err=True,
-                    )
-                    raise typer.Exit(1)
+            if not is_valid_cpu_list(cpu_cores):
+                typer.echo(
+                    "Error: Invalid CPU cores format. Use formats like '0-3', '0,2,4', or '0-3,8-11'",
+                    err=True,
+                )
+                raise typer.Exit(1)
 
             if dry_run:
                 typer.echo(f"CPU cores binding: {cpu_cores}")
@@ -369,7 +386,7 @@ def run_command(
         generated_config_path = generate_config_from_template(cores, effective_spec_root, tune, config_add, compiler)
 
         if generated_config_path:
-            logger.debug(f"🐛 Config generated: {generated_config_path}")
+            logger.debug("🐛 Config generated: {}", generated_config_path)
         else:
             logger.warning("⚠️  Failed to generate config file from template")
 
@@ -409,6 +426,21 @@ def run_command(
         )
         raise typer.Exit(1)
 
+    # Initialize EvalSync worker if sync is enabled and send the ready signal in the
+    # background, overlapping the manager round-trip with the remaining local prep
+    evalsync_worker = None
+    ready_future: Future[None] | None = None
+    if sync and not dry_run:
+        evalsync_worker = create_evalsync_worker(verbose=verbose)
+        if evalsync_worker:
+            logger.debug("🐛 Sending ready signal to EvalSync")
+            ready_future = evalsync_worker.ready_async()
+        else:
+            typer.echo(
+                "Warning: EvalSync integration requested but evalsync is not available",
+                err=True,
+            )
+
     # Convert simple benchmark names to full SPEC names
     if not speed and not rate:
         # Auto-detect preference from existing benchmarks
@@ -416,9 +448,9 @@ def run_command(
     else:
         prefer_speed, prefer_rate = speed, rate
 
-    logger.debug(f"🐛 Converting benchmarks: {benchmarks}")
+    logger.debug("🐛 Converting benchmarks: {}", benchmarks)
     converted_benchmarks = convert_benchmark_names(benchmarks, prefer_speed, prefer_rate)
-    logger.debug(f"🐛 Converted benchmarks: {converted_benchmarks}")
+    logger.debug("🐛 Converted benchmarks: {}", converted_benchmarks)
 
     if dry_run and converted_benchmarks != benchmarks:
         typer.echo(f"Converted benchmark names: {benchmarks} -> {converted_benchmarks}")
@@ -429,15 +461,9 @@ def run_command(
 
     if cores is not None:
         # Detect if we're running rate or speed benchmarks
-        is_rate_benchmark = any(
-            bench
-            for bench in converted_benchmarks
-            if bench.endswith("_r") or bench in ["intrate", "fprate", "specrate"]
-        )
+        is_rate_benchmark = any(bench for bench in converted_benchmarks if bench.endswith("_r") or bench in RATE_SUITES)
         is_speed_benchmark = any(
-            bench
-            for bench in converted_benchmarks
-            if bench.endswith("_s") or bench in ["intspeed", "fpspeed", "specspeed"]
+            bench for bench in converted_benchmarks if bench.endswith("_s") or bench in SPEED_SUITES
         )
 
         if is_rate_benchmark and not is_speed_benchmark:
@@ -495,27 +521,31 @@ def run_command(
                     err=True,
                 )
 
-    cmd = build_runcpu_command(
-        action="run",
-        benchmarks=converted_benchmarks,
-        config=effective_config,
-        tune=tune,
-        spec_root=effective_spec_root,
-        verbose=verbose,
-        rebuild=rebuild,
-        parallel_test=parallel_test,
-        ignore_errors=ignore_errors,
-        size=size,
-        copies=effective_copies,
-        threads=effective_threads,
-        iterations=iterations,
-        reportable=reportable,
-        noreportable=noreportable,
-        output_formats=output_formats,
-        nobuild=skip_compile,
-    )
-
-    logger.debug(f"🐛 Built runcpu command: {' '.join(cmd)}")
+    try:
+        cmd = build_runcpu_command(
+            action="run",
+            benchmarks=converted_benchmarks,
+            config=effective_config,
+            tune=tune,
+            spec_root=effective_spec_root,
+            verbose=verbose,
+            rebuild=rebuild,
+            parallel_test=parallel_test,
+            ignore_errors=ignore_errors,
+            size=size,
+            copies=effective_copies,
+            threads=effective_threads,
+            iterations=iterations,
+            reportable=reportable,
+            noreportable=noreportable,
+            output_formats=output_formats,
+            nobuild=skip_compile,
+        )
+    except BaseException:
+        _abort_evalsync(evalsync_worker, ready_future)
+        raise
+
+    logger.opt(lazy=True).debug("🐛 Built runcpu command: {}", lambda: " ".join(cmd))
 
     if dry_run:
         if skip_compile:
@@ -542,27 +572,24 @@ def run_command(
     # Also respect the deprecated --quiet flag for backward compatibility
     hide_logs = not verbose or quiet
 
-    # Initialize EvalSync worker if sync is enabled
-    evalsync_worker = None
-    if sync:
-        evalsync_worker = create_evalsync_worker(verbose=verbose)
-        if not evalsync_worker:
-            typer.echo(
-                "Warning: EvalSync integration requested but evalsync is not available",
-                err=True,
-            )
-
     try:
-        # Send ready signal - tasks are compiled and ready to run
-        if evalsync_worker:
-            logger.debug("🐛 Sending ready signal to EvalSync")
-            evalsync_worker.ready()
-            logger.debug("🐛 Waiting for start signal from EvalSync")
-            evalsync_worker.wait_for_start()
+        # Make sure the ready signal went out before waiting for the start signal
+        if evalsync_worker and ready_future:
+            try:
+                evalsync_worker.wait_initialized()
+            except Exception as e:
+                # As when evalsync is unavailable, run without synchronization
+                typer.echo(f"Warning: EvalSync connection failed, running without sync: {e}", err=True)
+                _abort_evalsync(evalsync_worker, ready_future)
+                evalsync_worker = None
+            else:
+                ready_future.result()
+                logger.debug("🐛 Waiting for start signal from EvalSync")
+                evalsync_worker.wait_for_start()
 
         # Execute the command with optional result parsing and time tracking
         logger.debug("🐛 Executing runcpu command")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         result_info = execute_runcpu(
             cmd,
             verbose=verbose,
@@ -574,9 +601,8 @@ def run_command(
             cpu_cores=cpu_cores,
             numa_memory=numa_memory,
         )
-        end_time = time.time()
-        total_elapsed = end_time - start_time
-        logger.debug(f"🐛 Execution completed in {total_elapsed:.2f}s")
+        total_elapsed = (time.monotonic_ns() - start_ns) / 1e9
+        logger.debug("🐛 Execution completed in {:.2f}s", total_elapsed)
 
         if evalsync_worker:
             evalsync_worker.end()
@@ -596,20 +622,32 @@ def run_command(
 
             # Prioritize RSF files for parsing (most accurate and complete data)
             rsf_files = [f for f in result_info["result_files"] if f["path"].endswith(".rsf")]
-            other_files = [f for f in result_info["result_files"] if not f["path"].endswith(".rsf")]
 
-            # Process RSF files first (they have the most complete data)
-            for file_info in rsf_files:
-                detailed_results = read_result_file(file_info["path"], effective_spec_root)
-                if detailed_results and detailed_results.get("benchmark_results"):
-                    all_benchmark_results.update(detailed_results["benchmark_results"])
-
-            # Only process other files if no RSF data was found
+            # Process RSF files first (they have the most complete data).
+            # Reportable runs emit one RSF per suite; parse them concurrently and
+            # merge on the main thread so no locking is needed.
+            if rsf_files:
+                with ThreadPoolExecutor(max_workers=min(8, len(rsf_files))) as executor:
+                    for detailed_results in executor.map(
+                        lambda file_info: read_result_file(file_info["path"], effective_spec_root),
+                        rsf_files,
+                    ):
+                        if detailed_results and detailed_results.get("benchmark_results"):
+                            all_benchmark_results.update(detailed_results["benchmark_results"])
+
+            # Only process other files if no RSF data was found. runcpu writes each
+            # suite's report in several formats sharing one stem, so stop parsing a
+            # suite's sibling reports once one of them has yielded results.
             if not all_benchmark_results:
-                for file_info in other_files:
+                parsed_stems: set[str] = set()
+                for file_info in result_info["result_files"]:
+                    report_path = Path(file_info["path"])
+                    if report_path.suffix == ".rsf" or report_path.stem in parsed_stems:
+                        continue
                     detailed_results = read_result_file(file_info["path"], effective_spec_root)
-                    if detailed_results and detailed_results.get("benchmark_results"):
-                        all_benchmark_results.update(detailed_results["benchmark_results"])
+                    if detailed_results and (benchmark_results := detailed_results.get("benchmark_results")):
+                        all_benchmark_results.update(benchmark_results)
+                        parsed_stems.add(report_path.stem)
 
             if all_benchmark_results:
                 enriched_results["benchmark_results"] = all_benchmark_results
@@ -617,6 +655,18 @@ def run_command(
         # Add timing information
         enriched_results["execution_time"] = total_elapsed
 
+        # Start saving to JSON if requested, overlapping the write with the display below
+        json_future = None
+        if json_output is not None:
+            json_future = save_results_to_json_async(
+                enriched_results,
+                output_file=json_output if json_output else None,
+                benchmarks=converted_benchmarks,
+                config=effective_config,
+                embed_config=not config_sidecar,
+                pretty=pretty_json,
+            )
+
         # Display results based on output preference
         if use_rich:
             display_results_with_rich(enriched_results, show_timing=True)
@@ -654,22 +704,16 @@ def run_command(
 
             if enriched_results.get("execution_time"):
                 elapsed_time = enriched_results["execution_time"]
-                minutes = int(elapsed_time // 60)
-                seconds = elapsed_time % 60
+                whole_minutes, seconds = divmod(elapsed_time, 60)
+                minutes = int(whole_minutes)
                 time_str = f"{minutes}m {seconds:.1f}s" if minutes > 0 else f"{seconds:.1f}s"
                 typer.echo(f"\n⏱️  Execution Time: {time_str}")
 
-        # Save to JSON if requested
-        if json_output is not None:
-            json_path = save_results_to_json(
-                enriched_results,
-                output_file=json_output if json_output else None,
-                benchmarks=converted_benchmarks,
-                config=effective_config,
-            )
+        # Report the JSON save once it has finished
+        if json_future is not None:
+            json_path = json_future.result()
             if use_rich:
-                console = Console()
-                console.print(
+                get_console().print(
                     Panel(
                         f"[green]💾 Results saved to:[/green] [cyan]{json_path}[/cyan]",
                         border_style="green",
@@ -681,3 +725,13 @@ def run_command(
     # Clean up EvalSync worker
     if evalsync_worker:
         evalsync_worker.cleanup()
+
+
+def _abort_evalsync(evalsync_worker: SpecerEvalSyncWorker | None, ready_future: Future[None] | None) -> None:
+    """Clean up the EvalSync worker when the run is aborted before execution."""
+    if evalsync_worker is None:
+        return
+    if ready_future is not None:
+        # Let the in-flight ready signal settle before tearing down the connection
+        ready_future.exception()
+    evalsync_worker.cleanup()
@@ -3,7 +3,7 @@
 from typing import Annotated
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
@@ -19,6 +19,13 @@ def topology_command(
             help="Show detailed topology information",
         ),
     ] = False,
+    refresh_topology: Annotated[
+        bool,
+        typer.Option(
+            "--refresh-topology",
+            help="Ignore the cached topology and detect it again",
+        ),
+    ] = False,
 ) -> None:
     """Display NUMA topology and CPU information.
 
@@ -28,11 +35,12 @@ def topology_command(
     Examples:
         specer topology                    # Show basic NUMA topology
         specer topology --verbose          # Show detailed information
+        specer topology --refresh-topology # Re-detect instead of using the cache
     """
     console = Console()
 
     # Try to get NUMA topology
-    topology = validate_numa_topology()
+    topology = validate_numa_topology(refresh=refresh_topology)
 
     if topology is None:
         console.print("❌ [red]NUMA topology not available[/red]")
@@ -47,13 +55,14 @@ def topology_command(
         console.print("  • Fedora: [cyan]sudo dnf install numactl[/cyan]")
         raise typer.Exit(1)
 
-    # Display topology information
-    console.print()
-    console.print(
+    # Display topology information; everything is collected into one group and
+    # rendered with a single print
+    parts: list[RenderableType] = [
+        "",
         Panel.fit(
             "[bold blue]🖥️  NUMA Topology Information[/bold blue]", border_style="blue"
-        )
-    )
+        ),
+    ]
 
     # Summary table
     summary_table = Table(title="📊 System Summary", show_header=True)
@@ -61,11 +70,14 @@ def topology_command(
     summary_table.add_column("Value", style="green")
 
     summary_table.add_row("Total NUMA Nodes", str(len(topology["nodes"])))
-    summary_table.add_row("Available Nodes", ", ".join(map(str, topology["nodes"])))
+    nodes = topology["nodes"]
+    summary_table.add_row(
+        "Available Nodes",
+        ", ".join(map(str, nodes)) if len(nodes) <= 32 else _format_ranges(nodes),
+    )
     summary_table.add_row("Total CPU Cores", str(topology["total_cpus"]))
 
-    console.print(summary_table)
-    console.print()
+    parts += [summary_table, ""]
 
     # NUMA nodes detail table
     if verbose:
@@ -76,13 +88,14 @@ def topology_command(
 
         for node_id in sorted(topology["nodes"]):
             cpus = topology["node_cpus"][node_id]
+            # Long lists are shown as ranges; nodes with interleaved CPUs (e.g. SMT
+            # siblings) yield several ranges rather than a misleading first-last
             cpu_str = (
-                ", ".join(map(str, cpus)) if len(cpus) <= 8 else f"{cpus[0]}-{cpus[-1]}"
+                ", ".join(map(str, cpus)) if len(cpus) <= 8 else _format_ranges(cpus)
             )
             numa_table.add_row(str(node_id), cpu_str, str(len(cpus)))
 
-        console.print(numa_table)
-        console.print()
+        parts += [numa_table, ""]
 
     # Usage examples
     examples_table = Table(title="💡 Usage Examples", show_header=True)
@@ -110,4 +123,18 @@ def topology_command(
             f"Bind to NUMA node {node0} with specific cores",
         )
 
-    console.print(examples_table)
+    parts.append(examples_table)
+    console.print(Group(*parts))
+
+
+def _format_ranges(ids: list[int]) -> str:
+    """Render a sorted list of ids as compact ranges, e.g. [0, 1, 2, 5] -> '0-2,5'."""
+    ranges: list[str] = []
+    start = prev = ids[0]
+    for value in ids[1:]:
+        if value != prev + 1:
+            ranges.append(f"{start}-{prev}" if prev != start else str(start))
+            start = value
+        prev = value
+    ranges.append(f"{start}-{prev}" if prev != start else str(start))
+    return ",".join(ranges)
@@ -1,6 +1,9 @@
 """Update command for SPEC CPU 2017 installation."""
 
+import os
+import pty
 import subprocess
+import termios
 from pathlib import Path
 from typing import Annotated
 
@@ -9,6 +12,7 @@ from rich.console import Console
 
 from specer.utils import (
     build_runcpu_command,
+    iter_output_lines,
     validate_and_get_spec_root,
 )
 
@@ -80,42 +84,49 @@ def _execute_update_with_confirmation(cmd: list[str]) -> None:
     console.print("─" * 80, style="dim")
 
     try:
-        # Use a more reliable approach: run with echo piped to stdin
-        # This ensures the 'y' response is available when the prompt appears
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            stdin=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
-        )
-
-        # Pre-feed the 'y' response to stdin immediately
-        if process.stdin is not None:
-            try:
-                process.stdin.write("y\n")
-                process.stdin.flush()
-                process.stdin.close()  # Close stdin so the process knows no more input is coming
-            except (BrokenPipeError, OSError):
-                # Process may have closed stdin already
-                pass
-
-        # Stream output in real-time
-        while True:
-            if process.stdout is None:
-                break
-            output = process.stdout.readline()
-            if output == "" and process.poll() is not None:
-                break
-            if output:
-                # Print each line directly for real-time viewing
-                console.print(output.rstrip(), highlight=False)
-
-                # Show when the prompt appears (we've already sent the response)
-                if "Proceed with update? (y/n)" in output:
-                    console.print("[dim]Auto-responding: y[/dim]")
+        # Run runcpu on a pseudo-terminal so it line-buffers its output the way it
+        # would interactively, instead of block-buffering into a pipe
+        master_fd, slave_fd = pty.openpty()
+        try:
+            # Turn off echo so the pre-fed answer does not show up in the output
+            attrs = termios.tcgetattr(slave_fd)
+            attrs[3] &= ~termios.ECHO
+            termios.tcsetattr(slave_fd, termios.TCSANOW, attrs)
+
+            process = subprocess.Popen(
+                cmd,
+                stdin=slave_fd,
+                stdout=slave_fd,
+                stderr=slave_fd,
+            )
+            os.close(slave_fd)
+            slave_fd = -1
+
+            # Pre-feed the 'y' response; the terminal queues it until runcpu reads
+            # the prompt answer. The trailing ^D gives any further read an EOF,
+            # like closing the stdin pipe did, so runcpu cannot block on input.
+            os.write(master_fd, b"y\n\x04")
+
+            # Stream output in real-time
+            for lines in iter_output_lines(master_fd):
+                # Write each read's worth of lines in one go; console.out skips
+                # Rich markup parsing, which raw runcpu output should not get anyway
+                pending: list[str] = []
+                for output in lines:
+                    pending.append(output)
+
+                    # Show when the prompt appears (we've already sent the response)
+                    if "Proceed with update? (y/n)" in output:
+                        console.out("\n".join(pending), highlight=False)
+                        pending.clear()
+                        console.print("[dim]Auto-responding: y[/dim]")
+
+                if pending:
+                    console.out("\n".join(pending), highlight=False)
+        finally:
+            os.close(master_fd)
+            if slave_fd != -1:
+                os.close(slave_fd)
 
         # Wait for process to complete and get return code
         return_code = process.wait()
@@ -25,7 +25,6 @@ from typing import Any
 
 from loguru import logger
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.theme import Theme
 
@@ -46,6 +45,14 @@ SPECR_THEME = Theme(
 
 console = Console(theme=SPECR_THEME, stderr=True)
 
+# Record layout in verbose mode: time, level and source location around the message
+_VERBOSE_FORMAT = "[{time:HH:mm:ss}] {level: <8} {message} ({name}:{function}:{line})"
+
+# Verbosity chosen by setup_logging, checked by the helpers below before they build
+# a message that would only be filtered out again
+_VERBOSE = False
+_QUIET = False
+
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Set up unified logging with rich and loguru.
@@ -54,6 +61,10 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
         verbose: Enable verbose logging
         quiet: Suppress non-essential output
     """
+    global _VERBOSE, _QUIET
+    _VERBOSE = verbose
+    _QUIET = quiet
+
     # Remove default logger
     logger.remove()
 
@@ -65,30 +76,31 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     else:
         log_level = "INFO"
 
-    # Add rich handler to loguru
+    # Write records straight to the Rich console. Going through RichHandler would
+    # format each record twice (once by loguru, once by the logging handler).
     logger.add(
-        RichHandler(
-            console=console,
-            rich_tracebacks=True,
-            tracebacks_show_locals=verbose,
-            show_time=verbose,
-            show_level=verbose,
-            show_path=verbose,
-        ),
+        _console_sink,
         level=log_level,
-        format="{message}",
+        format=_VERBOSE_FORMAT if verbose else "{message}",
+        backtrace=verbose,
+        diagnose=verbose,
     )
 
 
+def _console_sink(message: Any) -> None:
+    """Loguru sink that writes formatted records to the shared Rich console."""
+    console.out(message, end="", highlight=False)
+
+
 def specer_info(message: str, **kwargs: Any) -> None:
     """Log info message for specer operations."""
-    if not getattr(logger, "_specer_quiet", False):
+    if not _QUIET:
         logger.info(f"ℹ️  {message}", **kwargs)
 
 
 def specer_success(message: str, **kwargs: Any) -> None:
     """Log success message for specer operations."""
-    if not getattr(logger, "_specer_quiet", False):
+    if not _QUIET:
         logger.info(f"✅ {message}", **kwargs)
 
 
@@ -102,16 +114,23 @@ def specer_error(message: str, **kwargs: Any) -> None:
     logger.error(f"❌ {message}", **kwargs)
 
 
+def debug_enabled() -> bool:
+    """Return whether debug output is shown, to skip work only needed for it."""
+    return _VERBOSE
+
+
 def specer_debug(message: str, **kwargs: Any) -> None:
     """Log debug message for specer operations."""
-    if getattr(logger, "_specer_verbose", False):
-        logger.debug(f"🐛 {message}", **kwargs)
+    if not _VERBOSE:
+        return
+    logger.debug(f"🐛 {message}", **kwargs)
 
 
 def spec_output(message: str, **kwargs: Any) -> None:
     """Log SPEC CPU output (distinguished from specer output)."""
-    if getattr(logger, "_specer_verbose", False):
-        logger.info(f"[dim]{message}[/dim]", **kwargs)
+    if not _VERBOSE:
+        return
+    logger.info(f"[dim]{message}[/dim]", **kwargs)
 
 
 def spec_error(message: str, **kwargs: Any) -> None:
@@ -156,6 +175,7 @@ def log_command_complete(command: str, return_code: int, **kwargs: Any) -> None:
 # Export console for direct use
 __all__ = [
     "setup_logging",
+    "debug_enabled",
     "specer_info",
     "specer_success",
     "specer_warning",
@@ -1,11 +1,97 @@
 """Result parsing functionality for SPEC CPU 2017 output."""
 
+import mmap
+import os
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import typer
 
+# RSF (Raw Spec File) patterns, compiled once as bytes patterns so that RSF files
+# can be scanned directly through a read-only memory map without decoding
+_RSF_PATTERNS: tuple[tuple[str, re.Pattern[bytes]], ...] = tuple(
+    (name, re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+    for name, pattern in {
+        # Suite-level scores in RSF format (base and peak)
+        "suite_mean": rb"spec\.cpu2017\.(base|peak)mean:\s*([\d.]+)",
+        "suite_energy": rb"spec\.cpu2017\.(base|peak)energymean:\s*([\d.]+)",
+        # Individual benchmark results in RSF format - detailed results structure,
+        # all fields matched in a single scan
+        # Format: spec.cpu2017.results.648_exchange2_s.base.000.ratio: 12.380557
+        "detailed": rb"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.(ratio|reported_sec|reference|copies|threads):\s*([\d.]+)",
+        # Legacy format fallbacks (for other RSF variations)
+        "benchmark": rb"spec\.cpu2017\.(\d{3}\.\w+(?:_[rs])?)\.(?:base|peak)\.(ratio|time|result):\s*([\d.]+)",
+        # Error patterns (failed benchmarks)
+        "benchmark_error": rb"spec\.cpu2017\.errors\d+:\s*(\d{3}\.\w+(?:_[rs])?)\s*\([^)]+\)\s*(.+)",
+    }.items()
+)
+
+# Benchmark result fields in detailed RSF keys, keyed by their lowercased RSF name
+_DETAILED_FIELDS: dict[bytes, str] = {
+    b"ratio": "ratio",
+    b"reported_sec": "time",
+    b"reference": "reference",
+    b"copies": "copies",
+    b"threads": "threads",
+}
+
+# Extensions of the result files runcpu reports (matched case-sensitively)
+_RESULT_EXTS: tuple[str, ...] = (".rsf", ".html", ".pdf", ".txt", ".ps")
+
+# runcpu stdout patterns used to find result files and scores, fused into a single
+# alternation so the whole output is scanned in one pass; matches are dispatched on
+# the name of the branch that matched
+_OUTPUT_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for name, pattern in (
+            ("result_file", r"The result.*?is in (?=(?P<result_path>\S*))"),
+            (
+                "score_line",
+                r"Est\. (?P<score_name>SPEC\w+\d+_\w+_\w+)\s*=\s*(?P<score>[\d.]+)",
+            ),
+            (
+                "metric_line",
+                r"Est\. (?P<metric_name>SPEC\w+\d+_\w+)\s*=\s*(?P<metric>[\d.]+)",
+            ),
+            ("log_file", r"The log for this run is in (?=(?P<log_path>\S*))"),
+            (
+                "report_location",
+                r"(?:format to|reports are in) (?=(?P<report_path>\S*))",
+            ),
+            # Any other whitespace-delimited word naming a result file
+            (
+                "file_word",
+                rf"(?<!\S)\S*(?-i:{'|'.join(map(re.escape, _RESULT_EXTS))})(?!\S)",
+            ),
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Text/HTML report patterns, also scanned as bytes through a memory map
+_TEXT_PATTERNS: tuple[tuple[str, re.Pattern[bytes]], ...] = tuple(
+    (name, re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+    for name, pattern in (
+        # Overall suite scores (common in text reports)
+        ("overall_score", rb"Est\.\s+(SPEC\w+\d+_\w+_\w+)\s*=\s*([\d.]+)"),
+        ("suite_metric", rb"Est\.\s+(SPEC\w+\d+_\w+)\s*=\s*([\d.]+)"),
+        # Table format results (common in text/HTML)
+        (
+            "table_result",
+            rb"(\d{3}\.\w+(?:_[rs])?)\s+[\w\s]+\s+([\d.]+)\s+([\d.]+)",
+        ),
+        # HTML table patterns
+        (
+            "html_result",
+            rb"<td[^>]*>(\d{3}\.\w+(?:_[rs])?)</td>.*?<td[^>]*>([\d.]+)</td>.*?<td[^>]*>([\d.]+)</td>",
+        ),
+    )
+)
+
 
 def parse_result_files(output: str) -> dict[str, Any] | None:
     """Parse runcpu output to find result files and extract scores.
@@ -26,55 +112,29 @@ def parse_result_files(output: str) -> dict[str, Any] | None:
     result_files: list[dict[str, str]] = result_info["result_files"]
     scores: dict[str, float] = result_info["scores"]
     metrics: dict[str, float] = result_info["metrics"]
-
-    # Common patterns to find result files and scores
-    patterns = {
-        "result_file": r"The result.*?is in (.*?)(?:\s|$)",
-        "score_line": r"Est\. (SPEC\w+\d+_\w+_\w+)\s*=\s*([\d.]+)",
-        "metric_line": r"Est\. (SPEC\w+\d+_\w+)\s*=\s*([\d.]+)",
-        "log_file": r"The log for this run is in (.*?)(?:\s|$)",
-        "report_location": r"(?:format to|reports are in) (.*?)(?:\s|$)",
-        "rawfile": r".*\.rsf",
-        "formatted_result": r".*\.(html|pdf|txt|ps)$",
-    }
-
-    lines = output.split("\n")
-
-    for line in lines:
-        line = line.strip()
-
-        # Look for result file paths
-        for pattern_name, pattern in patterns.items():
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                if pattern_name == "result_file" or pattern_name == "report_location":
-                    file_path = match.group(1).strip()
-                    if file_path and file_path not in [
-                        item.get("path") for item in result_files
-                    ]:
-                        result_files.append({"path": file_path, "type": "result"})
-                elif pattern_name == "score_line":
-                    metric_name = match.group(1)
-                    score = float(match.group(2))
-                    scores[metric_name] = score
-                elif pattern_name == "metric_line":
-                    metric_name = match.group(1)
-                    score = float(match.group(2))
-                    metrics[metric_name] = score
-                elif pattern_name == "log_file":
-                    result_info["log_file"] = match.group(1).strip()
-
-        # Look for lines that mention specific result files
-        if any(ext in line.lower() for ext in [".rsf", ".html", ".pdf", ".txt", ".ps"]):
-            # Extract potential file paths
-            words = line.split()
-            for word in words:
-                if any(
-                    word.endswith(ext)
-                    for ext in [".rsf", ".html", ".pdf", ".txt", ".ps"]
-                ):
-                    if word not in [item.get("path") for item in result_files]:
-                        result_files.append({"path": word, "type": "result_file"})
+    seen_paths: set[str] = set()
+
+    for match in _OUTPUT_PATTERN.finditer(output):
+        kind = match.lastgroup
+        if kind == "result_file" or kind == "report_location":
+            file_path = match.group("result_path") or match.group("report_path")
+            if file_path and file_path not in seen_paths:
+                result_files.append({"path": file_path, "type": "result"})
+                seen_paths.add(file_path)
+        elif kind == "score_line":
+            score = float(match.group("score"))
+            scores[match.group("score_name")] = score
+            # Full metric names also satisfy the suite metric pattern
+            metrics[match.group("score_name")] = score
+        elif kind == "metric_line":
+            metrics[match.group("metric_name")] = float(match.group("metric"))
+        elif kind == "log_file":
+            result_info["log_file"] = match.group("log_path")
+        elif kind == "file_word":
+            word = match.group("file_word")
+            if word not in seen_paths:
+                result_files.append({"path": word, "type": "result_file"})
+                seen_paths.add(word)
 
     return (
         result_info
@@ -95,15 +155,13 @@ def read_result_file(file_path: str, spec_root: Path) -> dict[str, Any] | None:
     Returns:
         Dictionary containing extracted scores and metrics
     """
-    from pathlib import Path as PathLib
-
     # Convert relative paths to absolute paths
-    if not file_path.startswith("/"):
+    if not Path(file_path).is_absolute():
         # Try common locations for result files
         possible_paths = [
             spec_root / file_path,
             spec_root / "result" / file_path,
-            spec_root / "result" / PathLib(file_path).name,
+            spec_root / "result" / Path(file_path).name,
         ]
 
         actual_path = None
@@ -122,149 +180,143 @@ def read_result_file(file_path: str, spec_root: Path) -> dict[str, Any] | None:
         "metrics": {},
         "benchmark_results": {},
     }
-    # Type hints for mypy
-    scores_data: dict[str, float] = result_data["scores"]
-    metrics_data: dict[str, float] = result_data["metrics"]
-    benchmark_results: dict[str, dict[str, float]] = result_data["benchmark_results"]
+    # Pick the pattern set and its match handlers once for this file type,
+    # prioritizing RSF format for most accurate and complete data
+    if file_path.endswith(".rsf"):
+        patterns, handlers = _RSF_PATTERNS, _RSF_HANDLERS
+    else:
+        patterns, handlers = _TEXT_PATTERNS, _TEXT_HANDLERS
 
     try:
-        with Path(file_path).open(encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-
-        # Determine file type and parse accordingly
-        # Prioritize RSF format for most accurate and complete data
-        is_rsf_file = file_path.endswith(".rsf")
-
-        if is_rsf_file:
-            # RSF (Raw Spec File) format parsing
-            patterns = {
-                # Suite-level scores in RSF format
-                "suite_base_mean": r"spec\.cpu2017\.basemean:\s*([\d.]+)",
-                "suite_peak_mean": r"spec\.cpu2017\.peakmean:\s*([\d.]+)",
-                "suite_base_energy": r"spec\.cpu2017\.baseenergymean:\s*([\d.]+)",
-                "suite_peak_energy": r"spec\.cpu2017\.peakenergymean:\s*([\d.]+)",
-                # Individual benchmark results in RSF format - detailed results structure
-                # Format: spec.cpu2017.results.648_exchange2_s.base.000.ratio: 12.380557
-                "detailed_ratio": r"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.ratio:\s*([\d.]+)",
-                "detailed_time": r"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.reported_sec:\s*([\d.]+)",
-                "detailed_reference": r"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.reference:\s*([\d.]+)",
-                "detailed_copies": r"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.copies:\s*([\d.]+)",
-                "detailed_threads": r"spec\.cpu2017\.results\.(\d{3}_\w+(?:_[rs])?)\.(?:base|peak)\.000\.threads:\s*([\d.]+)",
-                # Legacy format fallbacks (for other RSF variations)
-                "benchmark_ratio": r"spec\.cpu2017\.(\d{3}\.\w+(?:_[rs])?)\.(?:base|peak)\.ratio:\s*([\d.]+)",
-                "benchmark_time": r"spec\.cpu2017\.(\d{3}\.\w+(?:_[rs])?)\.(?:base|peak)\.time:\s*([\d.]+)",
-                "benchmark_result": r"spec\.cpu2017\.(\d{3}\.\w+(?:_[rs])?)\.(?:base|peak)\.result:\s*([\d.]+)",
-                # Error patterns (failed benchmarks)
-                "benchmark_error": r"spec\.cpu2017\.errors\d+:\s*(\d{3}\.\w+(?:_[rs])?)\s*\([^)]+\)\s*(.+)",
-            }
-        else:
-            # Text/HTML format parsing for other result file types
-            patterns = {
-                # Overall suite scores (common in text reports)
-                "overall_score": r"Est\.\s+(SPEC\w+\d+_\w+_\w+)\s*=\s*([\d.]+)",
-                "suite_metric": r"Est\.\s+(SPEC\w+\d+_\w+)\s*=\s*([\d.]+)",
-                # Table format results (common in text/HTML)
-                "table_result": r"(\d{3}\.\w+(?:_[rs])?)\s+[\w\s]+\s+([\d.]+)\s+([\d.]+)",
-                # HTML table patterns
-                "html_result": r"<td[^>]*>(\d{3}\.\w+(?:_[rs])?)</td>.*?<td[^>]*>([\d.]+)</td>.*?<td[^>]*>([\d.]+)</td>",
-            }
-
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-
-            for match in matches:
-                if is_rsf_file:
-                    # Handle RSF format patterns
-                    if pattern_name in ["suite_base_mean", "suite_peak_mean"]:
-                        score = float(match)
-                        metric_name = f"SPEC{'int' if 'intspeed' in file_path or 'intrate' in file_path else 'fp'}2017_{'rate' if 'rate' in file_path else 'speed'}_{'base' if 'base' in pattern_name else 'peak'}"
-                        scores_data[metric_name] = score
-
-                    elif pattern_name in ["suite_base_energy", "suite_peak_energy"]:
-                        if match != "--":  # Skip "no data" entries
-                            score = float(match)
-                            metric_name = (
-                                f"Energy_{'base' if 'base' in pattern_name else 'peak'}"
-                            )
-                            metrics_data[metric_name] = score
-
-                    elif pattern_name.startswith("detailed_"):
-                        # Handle detailed benchmark results (spec.cpu2017.results.XXX.base.000.YYY)
-                        benchmark_name = match[
-                            0
-                        ].replace(
-                            "_", ".", 1
-                        )  # Convert 648_exchange2_s to 648.exchange2_s (only first underscore)
-                        value = float(match[1])
-                        if benchmark_name not in benchmark_results:
-                            benchmark_results[benchmark_name] = {}
-
-                        metric_type = pattern_name.split("_", 1)[
-                            1
-                        ]  # ratio, time, reference, copies, threads
-                        if metric_type == "time":
-                            benchmark_results[benchmark_name]["time"] = value
-                        elif metric_type == "ratio":
-                            benchmark_results[benchmark_name]["ratio"] = value
-                        elif metric_type == "reference":
-                            benchmark_results[benchmark_name]["reference"] = value
-                        elif metric_type == "copies":
-                            benchmark_results[benchmark_name]["copies"] = int(value)
-                        elif metric_type == "threads":
-                            benchmark_results[benchmark_name]["threads"] = int(value)
-
-                    elif pattern_name in [
-                        "benchmark_ratio",
-                        "benchmark_time",
-                        "benchmark_result",
-                    ]:
-                        # Legacy format fallback
-                        benchmark = match[0]
-                        value = float(match[1])
-                        if benchmark not in benchmark_results:
-                            benchmark_results[benchmark] = {}
-
-                        metric_type = pattern_name.split("_")[
-                            1
-                        ]  # ratio, time, or result
-                        benchmark_results[benchmark][metric_type] = value
-
-                    elif pattern_name == "benchmark_error":
-                        benchmark = match[0]
-                        error_msg = match[1]
-                        # Only record error info for benchmarks that actually have results
-                        # Skip benchmarks that didn't run at all
-                        if benchmark in benchmark_results and benchmark_results[
-                            benchmark
-                        ].get("ratio"):
-                            # Benchmark has results but SPEC flagged it - add warning
-                            benchmark_results[benchmark]["warning"] = error_msg
-                        # If benchmark has no results, don't add it to the results at all
-
-                else:
-                    # Handle text/HTML format patterns
-                    if pattern_name in ["overall_score", "suite_metric"]:
-                        metric_name = match[0]
-                        score = float(match[1])
-                        if "base" in metric_name or "peak" in metric_name:
-                            scores_data[metric_name] = score
-                        else:
-                            metrics_data[metric_name] = score
-
-                    elif pattern_name in ["table_result", "html_result"]:
-                        benchmark = match[0]
-                        try:
-                            ratio = float(match[1])
-                            time = float(match[2])
-                            benchmark_results[benchmark] = {
-                                "ratio": ratio,
-                                "time": time,
-                            }
-                        except (ValueError, IndexError):
-                            continue
+        # Result reports can be many MB; scan them in place through a read-only
+        # memory map instead of reading and decoding the whole file into a str
+        with Path(file_path).open("rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for pattern_name, pattern in patterns:
+                        handlers[pattern_name](pattern.findall(content), result_data)
 
         return result_data
 
     except Exception as e:
         typer.echo(f"Warning: Could not parse result file {file_path}: {e}", err=True)
         return None
+
+
+# Match handlers. Each receives every ``findall`` match of its pattern and the
+# result dict being filled in, so the per-match loop runs with the builtins and
+# bound dict methods it needs held in locals.
+
+
+def _handle_rsf_suite_mean(matches: list[Any], result_data: dict[str, Any]) -> None:
+    _float = float
+    prefix = _rsf_suite_metric_prefix(result_data["file_path"])
+    scores = result_data["scores"]
+    for match in matches:
+        scores[prefix + match[0].decode().lower()] = _float(match[1])
+
+
+@lru_cache(maxsize=32)
+def _rsf_suite_metric_prefix(file_path: str) -> str:
+    """Return the suite metric name prefix (e.g. 'SPECint2017_rate_') for an RSF file."""
+    suite_kind = "int" if "intspeed" in file_path or "intrate" in file_path else "fp"
+    suite_mode = "rate" if "rate" in file_path else "speed"
+    return f"SPEC{suite_kind}2017_{suite_mode}_"
+
+
+def _handle_rsf_suite_energy(matches: list[Any], result_data: dict[str, Any]) -> None:
+    _float = float
+    metrics = result_data["metrics"]
+    for match in matches:
+        if match[1] != b"--":  # Skip "no data" entries
+            metrics[f"Energy_{match[0].decode().lower()}"] = _float(match[1])
+
+
+def _handle_rsf_detailed(matches: list[Any], result_data: dict[str, Any]) -> None:
+    # Handle detailed benchmark results (spec.cpu2017.results.XXX.base.000.YYY)
+    _float = float
+    _int = int
+    _setdefault = result_data["benchmark_results"].setdefault
+    fields = _DETAILED_FIELDS
+    for match in matches:
+        benchmark_name = (
+            match[0].decode().replace("_", ".", 1)
+        )  # Convert 648_exchange2_s to 648.exchange2_s (only first underscore)
+        metric_type = fields[match[1].lower()]
+        value = _float(match[2])
+        benchmark_data = _setdefault(benchmark_name, {})
+
+        if metric_type in ("copies", "threads"):
+            benchmark_data[metric_type] = _int(value)
+        else:  # ratio, time, reference
+            benchmark_data[metric_type] = value
+
+
+def _handle_rsf_legacy(matches: list[Any], result_data: dict[str, Any]) -> None:
+    # Legacy format fallback
+    _float = float
+    _setdefault = result_data["benchmark_results"].setdefault
+    for match in matches:
+        benchmark = match[0].decode()
+        metric_type = match[1].decode().lower()  # ratio, time, or result
+        _setdefault(benchmark, {})[metric_type] = _float(match[2])
+
+
+def _handle_rsf_error(matches: list[Any], result_data: dict[str, Any]) -> None:
+    benchmark_results = result_data["benchmark_results"]
+    for match in matches:
+        benchmark = match[0].decode()
+        error_msg = match[1].decode(errors="ignore")
+        # Only record error info for benchmarks that actually have results
+        # Skip benchmarks that didn't run at all
+        if benchmark in benchmark_results and benchmark_results[benchmark].get("ratio"):
+            # Benchmark has results but SPEC flagged it - add warning
+            benchmark_results[benchmark]["warning"] = error_msg
+        # If benchmark has no results, don't add it to the results at all
+
+
+def _handle_text_score(matches: list[Any], result_data: dict[str, Any]) -> None:
+    _float = float
+    scores = result_data["scores"]
+    metrics = result_data["metrics"]
+    for match in matches:
+        metric_name = match[0].decode()
+        score = _float(match[1])
+        if "base" in metric_name or "peak" in metric_name:
+            scores[metric_name] = score
+        else:
+            metrics[metric_name] = score
+
+
+def _handle_text_result(matches: list[Any], result_data: dict[str, Any]) -> None:
+    _float = float
+    benchmark_results = result_data["benchmark_results"]
+    for match in matches:
+        benchmark = match[0].decode()
+        try:
+            ratio = _float(match[1])
+            time = _float(match[2])
+        except (ValueError, IndexError):
+            continue
+        benchmark_results[benchmark] = {
+            "ratio": ratio,
+            "time": time,
+        }
+
+
+_MatchHandler = Callable[[list[Any], dict[str, Any]], None]
+
+_RSF_HANDLERS: dict[str, _MatchHandler] = {
+    "suite_mean": _handle_rsf_suite_mean,
+    "suite_energy": _handle_rsf_suite_energy,
+    "detailed": _handle_rsf_detailed,
+    "benchmark": _handle_rsf_legacy,
+    "benchmark_error": _handle_rsf_error,
+}
+
+_TEXT_HANDLERS: dict[str, _MatchHandler] = {
+    "overall_score": _handle_text_score,
+    "suite_metric": _handle_text_score,
+    "table_result": _handle_text_result,
+    "html_result": _handle_text_result,
+}
@@ -1,45 +1,123 @@
 """EvalSync integration for specer."""
 
+import atexit
+import contextlib
+import importlib.util
 import os
 import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from evalsync import ExperimentWorker
 from loguru import logger
-from rich.console import Console
-from rich.panel import Panel
 
-console = Console()
+if TYPE_CHECKING:
+    from evalsync import ExperimentWorker
+    from rich.console import Console
+    from rich.panel import Panel
+
+# EvalSync settings are fixed for the lifetime of the specer process, so read them
+# once at import; SpecerEvalSyncWorker(refresh=True) re-reads them
+_ENV_EXPERIMENT_ID = os.environ.get("EVALSYNC_EXPERIMENT_ID")
+_ENV_CLIENT_ID = os.environ.get("EVALSYNC_CLIENT_ID")
+
+
+# Connects to the manager and sends the ready signal in the background, in that
+# order, so callers can overlap the round-trips with other work
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evalsync")
+
+
+@lru_cache(maxsize=1)
+def _hostname() -> str:
+    """Return this machine's hostname, resolved once per process."""
+    return socket.gethostname()
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the console used for EvalSync status output, created on first print."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=8)
+def _init_panel(experiment_id: str, client_id: str) -> "Panel":
+    """Return the verbose initialization panel for an experiment/client pair."""
+    from rich.panel import Panel
+
+    return Panel(
+        f"✅ EvalSync worker initialized\n"
+        f"Experiment ID: {experiment_id}\n"
+        f"Client ID: {client_id}",
+        title="EvalSync Integration",
+        border_style="green",
+    )
+
+
+def _refresh_env() -> None:
+    """Re-read the EvalSync environment variables and the hostname."""
+    global _ENV_EXPERIMENT_ID, _ENV_CLIENT_ID
+    _ENV_EXPERIMENT_ID = os.environ.get("EVALSYNC_EXPERIMENT_ID")
+    _ENV_CLIENT_ID = os.environ.get("EVALSYNC_CLIENT_ID")
+    _hostname.cache_clear()
+
+
+class _NullWorker:
+    """Stand-in for an unconnected ExperimentWorker whose signals do nothing."""
+
+    __slots__ = ()
+
+    def ready(self) -> None:
+        pass
+
+    def wait_for_start(self) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def cleanup(self) -> None:
+        pass
+
+
+_NULL_WORKER = _NullWorker()
 
 
 class SpecerEvalSyncWorker:
     """Wrapper for EvalSync worker with specer-specific functionality."""
 
-    def __init__(self, verbose: bool = False):
+    __slots__ = ("experiment_id", "client_id", "verbose", "worker", "_init_future")
+
+    def __init__(self, verbose: bool = False, refresh: bool = False):
         """Initialize the EvalSync worker using environment variables.
 
         Args:
             verbose: Whether to enable verbose logging
+            refresh: Whether to re-read the environment instead of using the
+                values cached at import
 
         Raises:
             ImportError: If evalsync is not available
             ValueError: If required environment variables are not set
         """
 
-        # Always read from environment variables
-        self.experiment_id = os.environ.get("EVALSYNC_EXPERIMENT_ID")
-        self.client_id = os.environ.get("EVALSYNC_CLIENT_ID")
+        if refresh:
+            _refresh_env()
 
-        # If no client_id is provided, use hostname as default
-        if not self.client_id:
-            self.client_id = socket.gethostname()
-
-        if not self.experiment_id:
+        # Always read from environment variables
+        if not _ENV_EXPERIMENT_ID:
             raise ValueError(
                 "EVALSYNC_EXPERIMENT_ID environment variable is required when using --sync"
             )
+        self.experiment_id: str = _ENV_EXPERIMENT_ID
+        # If no client_id is provided, use hostname as default
+        self.client_id: str = _ENV_CLIENT_ID or _hostname()
 
         self.verbose = verbose
-        self.worker: ExperimentWorker | None = None
+        self.worker: ExperimentWorker | _NullWorker = _NULL_WORKER
+        self._init_future: Future[None] | None = None
 
         if self.verbose:
             logger.info(
@@ -50,85 +128,182 @@ class SpecerEvalSyncWorker:
         """Initialize the EvalSync worker connection."""
 
         try:
+            # evalsync pulls in asyncio and ssl, so only import it once --sync is used
+            from evalsync import ExperimentWorker
+
             self.worker = ExperimentWorker(
                 self.experiment_id, self.client_id, self.verbose
             )
             if self.verbose:
-                console.print(
-                    Panel(
-                        f"✅ EvalSync worker initialized\n"
-                        f"Experiment ID: {self.experiment_id}\n"
-                        f"Client ID: {self.client_id}",
-                        title="EvalSync Integration",
-                        border_style="green",
-                    )
-                )
+                _console().print(_init_panel(self.experiment_id, self.client_id))
             else:
-                console.print(
+                _console().print(
                     f"🔄 EvalSync worker connected (experiment: {self.experiment_id})"
                 )
         except Exception as e:
             logger.error(f"Failed to initialize EvalSync worker: {e}")
             raise
 
-    def ready(self) -> None:
-        """Signal that the worker is ready (e.g., compilation complete)."""
-        if not self.worker:
-            return
+    def initialize_async(self) -> None:
+        """Start initializing the EvalSync worker connection on a background thread.
+
+        The first signal sent afterwards waits for the connection to be ready; use
+        wait_initialized() to check for a failed connection before signalling.
+        """
+        self._init_future = _EXECUTOR.submit(self.initialize)
 
+    def wait_initialized(self) -> None:
+        """Wait for a background initialize_async() to finish.
+
+        Raises:
+            Exception: Whatever initialize() raised, on every call after a failure
+        """
+        if self._init_future is not None:
+            self._init_future.result()
+
+    def _call(
+        self,
+        name: str,
+        failure: str,
+        before: str | None = None,
+        after: str | None = None,
+        after_style: str | None = None,
+    ) -> None:
+        """Call a method on the underlying worker, printing status around it.
+
+        Args:
+            name: Name of the ExperimentWorker method to call
+            failure: What failed, for the error log (e.g. "send ready signal")
+            before: Status line printed before the call
+            after: Status line printed after the call succeeds
+            after_style: Rich style for the after line
+        """
+        self.wait_initialized()
         try:
-            self.worker.ready()
-            if self.verbose:
-                console.print("📡 Sent READY signal to EvalSync manager", style="green")
-            else:
-                console.print("🟢 Ready - waiting for start signal...")
+            if before:
+                _console().print(before)
+            getattr(self.worker, name)()
+            if after:
+                _console().print(after, style=after_style)
         except Exception as e:
-            logger.error(f"Failed to send ready signal: {e}")
+            logger.error("Failed to {}: {}", failure, e)
             raise
 
+    def ready(self) -> None:
+        """Signal that the worker is ready (e.g., compilation complete)."""
+        if self.verbose:
+            self._call(
+                "ready",
+                "send ready signal",
+                after="📡 Sent READY signal to EvalSync manager",
+                after_style="green",
+            )
+        else:
+            self._call(
+                "ready",
+                "send ready signal",
+                after="🟢 Ready - waiting for start signal...",
+            )
+
+    def ready_async(self) -> Future[None]:
+        """Send the ready signal on the background thread, after the connection.
+
+        Returns:
+            Future that completes once the ready signal has been delivered
+        """
+        return _EXECUTOR.submit(self.ready)
+
     def wait_for_start(self) -> None:
         """Wait for the start signal from the manager."""
-        if not self.worker:
-            return
-
-        try:
-            console.print("⏳ Waiting for start signal from EvalSync manager...")
-            self.worker.wait_for_start()
-            console.print(
-                "🚀 Received start signal - beginning benchmark execution",
-                style="green bold",
-            )
-        except Exception as e:
-            logger.error(f"Failed to wait for start signal: {e}")
-            raise
+        self._call(
+            "wait_for_start",
+            "wait for start signal",
+            before="⏳ Waiting for start signal from EvalSync manager...",
+            after="🚀 Received start signal - beginning benchmark execution",
+            after_style="green bold",
+        )
 
     def end(self) -> None:
         """End the EvalSync worker."""
-        if not self.worker:
-            return
-        self.worker.end()
+        self._call("end", "end EvalSync worker")
 
     def cleanup(self) -> None:
-        """Clean up the EvalSync worker connection."""
-        if not self.worker:
+        """Clean up the EvalSync worker connection.
+
+        A cleaned-up process-wide worker is released, so the next get_worker() call
+        creates and connects a fresh one.
+        """
+        global _WORKER_SINGLETON
+        with _WORKER_LOCK:
+            if _WORKER_SINGLETON is self:
+                _WORKER_SINGLETON = None
+
+        # Let an in-flight connection settle; initialize() already logged any failure
+        with contextlib.suppress(Exception):
+            self.wait_initialized()
+        if self.worker is _NULL_WORKER:
             return
 
+        worker, self.worker = self.worker, _NULL_WORKER
         try:
-            self.worker.cleanup()
+            worker.cleanup()
             if self.verbose:
-                console.print("🧹 EvalSync worker cleaned up", style="dim")
+                _console().print("🧹 EvalSync worker cleaned up", style="dim")
         except Exception as e:
             logger.warning(f"Failed to cleanup EvalSync worker: {e}")
 
 
+_WORKER_SINGLETON: SpecerEvalSyncWorker | None = None
+_WORKER_LOCK = threading.Lock()
+
+
+def get_worker(verbose: bool = False) -> SpecerEvalSyncWorker:
+    """Return the process-wide EvalSync worker, creating it on first use.
+
+    The connection is set up in the background, overlapping the evalsync import and
+    manager handshake with the caller's own preparation; the first signal sent waits
+    for it.
+
+    Args:
+        verbose: Whether to enable verbose logging (only used on first call)
+
+    Returns:
+        The SpecerEvalSyncWorker shared by the whole process
+
+    Raises:
+        ImportError: If evalsync is not available
+        ValueError: If required environment variables are not set
+    """
+    global _WORKER_SINGLETON
+    if _WORKER_SINGLETON is None:
+        with _WORKER_LOCK:
+            if _WORKER_SINGLETON is None:
+                worker = SpecerEvalSyncWorker(verbose)
+                # Fail up front when evalsync is missing, without paying for its import
+                if importlib.util.find_spec("evalsync") is None:
+                    raise ImportError("evalsync is not installed")
+                worker.initialize_async()
+                # Register once, even when a cleaned-up worker is replaced
+                atexit.unregister(_singleton_cleanup)
+                atexit.register(_singleton_cleanup)
+                _WORKER_SINGLETON = worker
+    return _WORKER_SINGLETON
+
+
+def _singleton_cleanup() -> None:
+    """Clean up the process-wide EvalSync worker at interpreter exit."""
+    if _WORKER_SINGLETON is not None:
+        _WORKER_SINGLETON.cleanup()
+
+
 def create_evalsync_worker(
     verbose: bool = False,
 ) -> SpecerEvalSyncWorker | None:
     """Create an EvalSync worker if evalsync is available.
 
+    Deprecated: use get_worker(), which this now delegates to.
+
     Args:
-        experiment_id: Ignored (kept for API compatibility)
-        client_id: Ignored (kept for API compatibility)
         verbose: Whether to enable verbose logging
 
     Returns:
@@ -136,9 +311,9 @@ def create_evalsync_worker(
     """
 
     try:
-        worker = SpecerEvalSyncWorker(verbose)
-        worker.initialize()
-        return worker
-    except Exception as e:
-        logger.error(f"Failed to create EvalSync worker: {e}")
+        return get_worker(verbose)
+    except (ImportError, ValueError) as e:
+        # Missing evalsync or missing environment. The manager connection is made in
+        # the background, so connection failures surface from wait_initialized()
+        logger.error("EvalSync unavailable: {}", e)
         return None
@@ -1,20 +1,37 @@
 """Shared utility functions for specer CLI."""
 
-import json
+import contextlib
+import errno
+import hashlib
 import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.table import Table
+from rich.console import Console, JustifyMethod
 
-from specer.logging import logger
+from specer.logging import debug_enabled, logger
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Writes result JSON off the main thread; its worker is joined at interpreter exit, so
+# pending saves always finish
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="specer-save")
 
 # Mapping of simple benchmark names to their SPEC CPU 2017 identifiers
 # Format: "simple_name": ("speed_version", "rate_version")
@@ -41,6 +58,91 @@ BENCHMARK_MAPPING: dict[str, tuple[str, str]] = {
     "roms": ("654.roms_s", "554.roms_r"),
 }
 
+# Suite names grouped by benchmark type
+SPEED_SUITES: frozenset[str] = frozenset({"intspeed", "fpspeed", "specspeed"})
+RATE_SUITES: frozenset[str] = frozenset({"intrate", "fprate", "specrate"})
+# Floating-point suites, the only ones the Intel compiler is configured for
+_FP_SUITES: frozenset[str] = frozenset({"fprate", "fpspeed"})
+# Every suite name runcpu accepts in place of individual benchmarks
+_SUITE_NAMES: frozenset[str] = SPEED_SUITES | RATE_SUITES | {"all"}
+
+# --compiler values that select Intel oneAPI
+_INTEL_COMPILERS: frozenset[str] = frozenset({"intel", "oneapi"})
+
+# Flattened lookup tables keyed by lowercase simple name, built once at import
+_SHORT_TO_SPEED: dict[str, str] = {name.lower(): speed for name, (speed, _rate) in BENCHMARK_MAPPING.items()}
+_SHORT_TO_RATE: dict[str, str] = {name.lower(): rate for name, (_speed, rate) in BENCHMARK_MAPPING.items()}
+
+# GCC version in `gcc --version` output, e.g. "gcc (GCC) 11.2.0"
+_GCC_VERSION_RE = re.compile(r"gcc.*?(\d+)\.(\d+)\.(\d+)", re.IGNORECASE)
+
+# Intel compiler version in `icx --version` output, e.g. "Intel(R) oneAPI DPC++/C++ Compiler 2024.0.0"
+_INTEL_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+)")
+
+# Names of the variables captured from the sourced oneAPI environment: anything
+# mentioning Intel/oneAPI, the library roots, or a search path (which also covers
+# CPATH, LIBRARY_PATH and LD_LIBRARY_PATH)
+_INTEL_ENV_KEY = re.compile(r"INTEL|ONEAPI|MKLROOT|TBBROOT|DAALROOT|IPPROOT|PATH", re.IGNORECASE)
+
+# Common patterns naming the current benchmark in SPEC output, fused into a single
+# alternation since it is tried against every line runcpu prints; each branch
+# captures the benchmark in its own (last) group
+_BENCH_ID = r"(\d{3}\.\w+(?:_[rs])?)"
+_BENCH_PATTERN = re.compile(
+    "|".join(
+        (
+            rf"(?:Running|Building|runcpu|specinvoke).*?{_BENCH_ID}",  # "Running 500.perlbench_r", "runcpu ... 519.lbm_r"
+            rf"{_BENCH_ID}\s*(?:base|peak)",  # "500.perlbench_r base"
+            rf"^{_BENCH_ID}:\s",  # "500.perlbench_r: "
+        )
+    ),
+    re.IGNORECASE,
+)
+# Bytes variant for scanning raw runcpu output a chunk of whole lines at a time;
+# \s after the name must not run into the next line
+_BENCH_PATTERN_BYTES = re.compile(
+    _BENCH_PATTERN.pattern.replace(r"\s*", r"[^\S\n]*").encode(),
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Per-node CPU lines in `numactl --hardware` output, e.g. "node 0 cpus: 0 1 2 3"
+_NUMACTL_NODE_CPUS = re.compile(r"^[ \t]*node[ \t]+(\d+)[ \t]+cpus:([^\n]*)", re.MULTILINE)
+
+# Deletes range/list separators from a CPU list, leaving only the CPU numbers
+_CPU_LIST_SEPARATORS = str.maketrans("", "", "-, ")
+# Characters allowed in a --cpu-cores list, e.g. "0-3,8-11"
+_CPU_LIST_PATTERN = re.compile(r"^[\d\-,\s]+$")
+
+# Files whose contents change with a reboot or CPU/node hotplug, invalidating the
+# cached NUMA topology
+_TOPOLOGY_CACHE_SOURCES = (
+    Path("/proc/sys/kernel/random/boot_id"),
+    Path("/sys/devices/system/cpu/online"),
+    Path("/sys/devices/system/node/online"),
+)
+
+# Per-node sysfs directories (node0, node1, ...), each with a cpulist file
+_SYSFS_NODE_DIR = Path("/sys/devices/system/node")
+
+# Read size for streaming runcpu output, and how much of it to keep in memory
+# before spilling to a temporary file
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+_OUTPUT_SPOOL_SIZE = 16 * 1024 * 1024
+
+# Minimum seconds between progress spinner description updates
+_PROGRESS_UPDATE_INTERVAL = 0.1
+
+
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Return the shared stdout console, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 class ProcessResult:
     """Simple result object compatible with subprocess.run."""
@@ -71,11 +173,15 @@ def validate_and_get_spec_root(spec_root: Path | None) -> Path:
         if env_spec_path:
             return Path(env_spec_path)
 
-        typer.echo("Error: --spec-root is required", err=True)
-        typer.echo("Please specify the path to your SPEC CPU 2017 installation:", err=True)
-        typer.echo("  specer <command> --spec-root /path/to/spec2017", err=True)
-        typer.echo("Or set the SPEC_PATH environment variable:", err=True)
-        typer.echo("  export SPEC_PATH=/path/to/spec2017", err=True)
+        # One write keeps the message together on stderr
+        typer.echo(
+            "Error: --spec-root is required\n"
+            "Please specify the path to your SPEC CPU 2017 installation:\n"
+            "  specer <command> --spec-root /path/to/spec2017\n"
+            "Or set the SPEC_PATH environment variable:\n"
+            "  export SPEC_PATH=/path/to/spec2017",
+            err=True,
+        )
         raise typer.Exit(1)
 
     return spec_root
@@ -97,45 +203,21 @@ def convert_benchmark_names(benchmarks: list[str], prefer_speed: bool = False, p
         convert_benchmark_names(["gcc"], prefer_rate=True) -> ["502.gcc_r"]
         convert_benchmark_names(["602.gcc_s"]) -> ["602.gcc_s"]  # unchanged
     """
-    converted = []
-
-    for benchmark in benchmarks:
-        # If it's already a full SPEC name (contains a dot and number), keep it as-is
-        if "." in benchmark and any(char.isdigit() for char in benchmark.split(".")[0]):
-            converted.append(benchmark)
-            continue
+    return list(_convert_benchmark_names(tuple(benchmarks), prefer_speed, prefer_rate))
 
-        # Handle standard suite names
-        if benchmark.lower() in [
-            "intspeed",
-            "fpspeed",
-            "specspeed",
-            "intrate",
-            "fprate",
-            "specrate",
-            "all",
-        ]:
-            converted.append(benchmark)
-            continue
 
-        # Check if it's a simple benchmark name
-        simple_name = benchmark.lower()
-        if simple_name in BENCHMARK_MAPPING:
-            speed_version, rate_version = BENCHMARK_MAPPING[simple_name]
+@lru_cache(maxsize=256)
+def _convert_benchmark_names(benchmarks: tuple[str, ...], prefer_speed: bool, prefer_rate: bool) -> tuple[str, ...]:
+    """Cached implementation of convert_benchmark_names.
 
-            if prefer_speed:
-                converted.append(speed_version)
-            elif prefer_rate:
-                converted.append(rate_version)
-            else:
-                # Default behavior: try to infer from existing pattern or use speed
-                # For now, default to speed version
-                converted.append(speed_version)
-        else:
-            # Unknown name, keep as-is and let runcpu handle the error
-            converted.append(benchmark)
-
-    return converted
+    The conversion is a pure name mapping, so results are memoized on the
+    (ordered) benchmark tuple and preference flags. Full SPEC names, suite
+    names and unknown names never appear in the lookup tables, so they pass
+    through unchanged and runcpu reports any errors.
+    """
+    # Speed versions win when both or neither preference is set
+    table = _SHORT_TO_RATE if prefer_rate and not prefer_speed else _SHORT_TO_SPEED
+    return tuple(table.get(benchmark.lower(), benchmark) for benchmark in benchmarks)
 
 
 def detect_suite_preference(benchmarks: list[str]) -> tuple[bool, bool]:
@@ -146,30 +228,50 @@ def detect_suite_preference(benchmarks: list[str]) -> tuple[bool, bool]:
     """
     speed_count = 0
     rate_count = 0
+    remaining = len(benchmarks)
 
     for benchmark in benchmarks:
-        if "_s" in benchmark or "speed" in benchmark.lower():
+        # Full SPEC names end in _s or _r; only other names need the substring checks
+        if benchmark.endswith("_s"):
             speed_count += 1
-        elif "_r" in benchmark or "rate" in benchmark.lower():
+        elif benchmark.endswith("_r"):
             rate_count += 1
+        else:
+            lowered = benchmark.lower()
+            if "_s" in benchmark or "speed" in lowered:
+                speed_count += 1
+            elif "_r" in benchmark or "rate" in lowered:
+                rate_count += 1
+
+        # Stop once the remaining benchmarks can no longer change the outcome
+        remaining -= 1
+        if abs(speed_count - rate_count) > remaining:
+            break
 
     return speed_count > rate_count, rate_count > speed_count
 
 
 def detect_gcc_version() -> int | None:
-    """Detect the GCC version using 'which gcc' and '--version'.
+    """Detect the GCC version by locating gcc on PATH and running '--version'.
+
+    Results are memoized per PATH value, so repeat calls only fork when PATH changes.
 
     Returns:
         The major version number of GCC, or None if detection fails
     """
-    # First check if gcc is available
-    which_result = subprocess.run(["which", "gcc"], capture_output=True, text=True, timeout=5)
+    return _detect_gcc_version(os.environ.get("PATH", ""))
 
-    if which_result.returncode != 0:
+
+@lru_cache(maxsize=4)
+def _detect_gcc_version(path_env: str) -> int | None:
+    """Cached implementation of detect_gcc_version, keyed by the PATH it ran under."""
+    # First check if gcc is available (an in-process PATH walk, no 'which' fork)
+    gcc_path = shutil.which("gcc", path=path_env or None)
+    if gcc_path is None:
         return None
 
     # Get GCC version
-    version_result = subprocess.run(["gcc", "--version"], capture_output=True, text=True, timeout=5)
+    version_result = subprocess.run([gcc_path, "--version"], capture_output=True, text=True, timeout=5)
 
     if version_result.returncode != 0:
         return None
@@ -179,7 +281,12 @@ def detect_gcc_version() -> int | None:
     version_output = version_result.stdout.strip()
 
     # Look for patterns like "gcc (...) X.Y.Z" or "gcc (GCC) X.Y.Z"
-    match = re.search(r"gcc.*?(\d+)\.(\d+)\.(\d+)", version_output, re.IGNORECASE)
+    major_version = _scan_gcc_major_version(version_output)
+    if major_version is not None:
+        return major_version
+
+    # Fall back to the regex for output the token scan doesn't recognize
+    match = _GCC_VERSION_RE.search(version_output)
     if match:
         major_version = int(match.group(1))
         return major_version
@@ -187,17 +294,29 @@ def detect_gcc_version() -> int | None:
     return None
 
 
+def _scan_gcc_major_version(version_output: str) -> int | None:
+    """Return the major version from the first X.Y.Z token on a line mentioning gcc."""
+    for line in version_output.splitlines():
+        if "gcc" not in line.lower():
+            continue
+        for token in line.split():
+            parts = token.split(".", 3)
+            if len(parts) >= 3 and parts[0].isdecimal() and parts[1].isdecimal() and parts[2].isdecimal():
+                return int(parts[0])
+    return None
+
+
 def detect_gcc_path() -> str | None:
-    """Detect the GCC installation path using 'which gcc'.
+    """Detect the GCC installation path by locating gcc on PATH.
 
     This function finds the GCC installation directory through a 4-step process:
 
-    1. **Step 1**: Run 'which gcc' to find the location of the gcc binary
+    1. **Step 1**: Look up gcc with shutil.which to find the location of the gcc binary
        - This uses the system's PATH to locate the gcc executable
        - Returns the full path to the gcc binary (e.g., /usr/bin/gcc)
 
-    2. **Step 2**: Extract the binary path from the 'which' output
-       - Strips whitespace and validates the path exists
+    2. **Step 2**: Validate the binary path
+       - shutil.which only returns existing executables
        - Example: /nix/store/.../bin/gcc
 
     3. **Step 3**: Calculate the installation directory
@@ -214,19 +333,21 @@ def detect_gcc_path() -> str | None:
         /opt/gcc-11.2.0/bin/gcc -> /opt/gcc-11.2.0
         /nix/store/...-gcc-wrapper/bin/gcc -> /nix/store/...-gcc-wrapper
 
+    Results are memoized per PATH value, so PATH is only searched again when it changes.
+
     Returns:
         The parent directory of the GCC binary (without /bin), or None if detection fails
     """
-    # First check if gcc is available
-    which_result = subprocess.run(["which", "gcc"], capture_output=True, text=True, timeout=5)
+    return _detect_gcc_path(os.environ.get("PATH", ""))
 
-    if which_result.returncode != 0:
-        logger.debug("🐛 GCC not found in PATH")
-        return None
 
-    gcc_path = which_result.stdout.strip()
-    if not gcc_path:
-        logger.debug("🐛 'which gcc' returned empty result")
+@lru_cache(maxsize=4)
+def _detect_gcc_path(path_env: str) -> str | None:
+    """Cached implementation of detect_gcc_path, keyed by the PATH it ran under."""
+    # First check if gcc is available
+    gcc_path = shutil.which("gcc", path=path_env or None)
+    if gcc_path is None:
+        logger.debug("🐛 GCC not found in PATH")
         return None
 
     logger.debug(f"🐛 Found GCC binary at: {gcc_path}")
@@ -256,36 +377,31 @@ def detect_intel_oneapi_path() -> str | None:
     3. Check common installation paths (/opt/intel/oneapi)
     4. Validate that setvars.sh exists for environment setup
 
+    Results are memoized per PATH and ONEAPI_ROOT value, so repeat calls only probe
+    the system again when either changes.
+
     Returns:
         Path to oneAPI installation root, or None if not found
     """
+    return _detect_intel_oneapi_path(os.environ.get("PATH", ""), os.environ.get("ONEAPI_ROOT"))
 
-    # Strategy 1: Check if icx is available in PATH
-    try:
-        which_result = subprocess.run(["which", "icx"], capture_output=True, text=True, timeout=5)
-
-        if which_result.returncode == 0:
-            icx_path = which_result.stdout.strip()
-            if icx_path:
-                logger.info(f"✅ Found ICX binary at: {icx_path}")
-
-                # Try to derive oneAPI root from icx path
-                # /opt/intel/oneapi/compiler/latest/linux/bin/icx -> /opt/intel/oneapi
-                current_path = Path(icx_path).parent
-
-                for _ in range(6):  # Reasonable limit to avoid infinite loops
-                    if current_path.name == "oneapi" and (current_path / "setvars.sh").exists():
-                        logger.info(f"✅ Intel oneAPI root found via icx: {current_path}")
-                        return str(current_path)
-                    current_path = current_path.parent
-                    if current_path == current_path.parent:  # Reached filesystem root
-                        break
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-        logger.warning(f"⚠️  Error running 'which icx': {e}")
 
-    # Strategy 2: Check ONEAPI_ROOT environment variable
-    oneapi_root = os.environ.get("ONEAPI_ROOT")
+@lru_cache(maxsize=4)
+def _detect_intel_oneapi_path(path_env: str, oneapi_root: str | None) -> str | None:
+    """Cached implementation of detect_intel_oneapi_path, keyed by the environment it ran under."""
+    # Strategy 1: Check if icx is available in PATH (an in-process PATH walk, no 'which' fork)
+    icx_path = shutil.which("icx", path=path_env or None)
+    if icx_path:
+        logger.info(f"✅ Found ICX binary at: {icx_path}")
 
+        # Try to derive oneAPI root from icx path, up to 6 levels above the binary
+        # /opt/intel/oneapi/compiler/latest/linux/bin/icx -> /opt/intel/oneapi
+        for current_path in Path(icx_path).parents[:6]:
+            if current_path.name == "oneapi" and (current_path / "setvars.sh").exists():
+                logger.info(f"✅ Intel oneAPI root found via icx: {current_path}")
+                return str(current_path)
+
+    # Strategy 2: Check ONEAPI_ROOT environment variable
     if oneapi_root:
         oneapi_path = Path(oneapi_root)
         setvars_path = oneapi_path / "setvars.sh"
@@ -309,26 +425,27 @@ def detect_intel_oneapi_path() -> str | None:
                 logger.info(f"✅ Intel oneAPI root found at: {oneapi_path}")
                 return str(oneapi_path)
 
-    # Strategy 4: Check current environment for Intel variables
-    intel_env_vars = {k: v for k, v in os.environ.items() if "INTEL" in k.upper() or "ONEAPI" in k.upper()}
-    if intel_env_vars:
-        for var, value in intel_env_vars.items():
-            logger.debug(f"🐛   {var}={value}")
-
-    # Strategy 5: Check PATH for Intel directories
-    path_env = os.environ.get("PATH", "")
-    intel_paths = [p for p in path_env.split(":") if "intel" in p.lower() or "oneapi" in p.lower()]
-    if intel_paths:
-        for intel_path in intel_paths:
-            # Try to find oneAPI root from these paths
-            current_path = Path(intel_path)
-            for _ in range(5):
-                if current_path.name == "oneapi" and (current_path / "setvars.sh").exists():
-                    logger.info(f"✅ Intel oneAPI root found via PATH analysis: {current_path}")
-                    return str(current_path)
-                current_path = current_path.parent
-                if current_path == current_path.parent:
-                    break
+    # Strategy 4: Check current environment for Intel variables (only ever logged)
+    if debug_enabled():
+        for var, value in os.environ.items():
+            if "INTEL" in var.upper() or "ONEAPI" in var.upper():
+                logger.debug(f"🐛   {var}={value}")
+
+    # Strategy 5: Check PATH for Intel directories, trying each one and up to 4
+    # levels above it, and stop at the first oneAPI root found
+    found_path = next(
+        (
+            current_path
+            for intel_path in path_env.split(":")
+            if "intel" in (lowered := intel_path.lower()) or "oneapi" in lowered
+            for current_path in (Path(intel_path), *Path(intel_path).parents[:4])
+            if current_path.name == "oneapi" and (current_path / "setvars.sh").exists()
+        ),
+        None,
+    )
+    if found_path is not None:
+        logger.info(f"✅ Intel oneAPI root found via PATH analysis: {found_path}")
+        return str(found_path)
 
     logger.warning("⚠️  Intel oneAPI not found using any detection strategy")
     return None
@@ -337,12 +454,21 @@ def detect_intel_oneapi_path() -> str | None:
 def setup_intel_oneapi_environment(oneapi_path: str) -> dict[str, str]:
     """Set up Intel oneAPI environment variables by sourcing setvars.sh.
 
+    Sourcing the script spawns a shell, so results are memoized per oneAPI path and
+    PATH value; each call returns a fresh copy the caller may modify.
+
     Args:
         oneapi_path: Path to Intel oneAPI installation root
 
     Returns:
         Dictionary of environment variables to be set
     """
+    return dict(_setup_intel_oneapi_environment(oneapi_path, os.environ.get("PATH", "")))
+
+
+@lru_cache(maxsize=4)
+def _setup_intel_oneapi_environment(oneapi_path: str, _path_env: str) -> dict[str, str]:
+    """Cached implementation of setup_intel_oneapi_environment, keyed by the PATH it ran under."""
     logger.info(f"🔧 Setting up Intel oneAPI environment from: {oneapi_path}")
     env_vars: dict[str, str] = {}
 
@@ -371,30 +497,15 @@ def setup_intel_oneapi_environment(oneapi_path: str) -> dict[str, str]:
             logger.info("✅ Successfully sourced setvars.sh")
 
             # Parse environment variables from output
-            env_lines = result.stdout.strip().split("\n")
+            env_lines = result.stdout.splitlines()
             logger.debug(f"🐛 Got {len(env_lines)} environment lines")
 
             for line in env_lines:
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    # Capture Intel-related and important PATH variables
-                    if any(
-                        intel_prefix in key.upper()
-                        for intel_prefix in [
-                            "INTEL",
-                            "ONEAPI",
-                            "MKLROOT",
-                            "TBBROOT",
-                            "DAALROOT",
-                            "IPPROOT",
-                            "CPATH",
-                            "LIBRARY_PATH",
-                            "LD_LIBRARY_PATH",
-                            "PATH",
-                        ]
-                    ):
-                        env_vars[key] = value
-                        logger.debug(f"🐛 Captured env var: {key}={value[:100]}...")
+                key, sep, value = line.partition("=")
+                # Capture Intel-related and important PATH variables
+                if sep and _INTEL_ENV_KEY.search(key):
+                    env_vars[key] = value
+                    logger.debug(f"🐛 Captured env var: {key}={value[:100]}...")
 
             logger.info(f"✅ Captured {len(env_vars)} Intel oneAPI environment variables")
 
@@ -417,9 +528,18 @@ def setup_intel_oneapi_environment(oneapi_path: str) -> dict[str, str]:
 def validate_intel_oneapi_setup() -> bool:
     """Validate that Intel oneAPI compilers are properly set up and accessible.
 
+    Results are memoized per PATH value, so the compilers are only run again when
+    PATH changes.
+
     Returns:
         True if at least C/C++ compilers are available and working, False otherwise
     """
+    return _validate_intel_oneapi_setup(os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=4)
+def _validate_intel_oneapi_setup(path_env: str) -> bool:
+    """Cached implementation of validate_intel_oneapi_setup, keyed by the PATH it ran under."""
     logger.info("🔍 Validating Intel oneAPI compiler setup...")
 
     # Essential compilers (C and C++) - these must work
@@ -434,13 +554,10 @@ def validate_intel_oneapi_setup() -> bool:
         logger.debug(f"🐛 Checking {compiler} compiler ({'essential' if is_essential else 'optional'})...")
 
         try:
-            # First check if compiler is in PATH
-            which_result = subprocess.run(["which", compiler], capture_output=True, text=True, timeout=5)
-
-            logger.debug(f"🐛 'which {compiler}' return code: {which_result.returncode}")
-            logger.debug(f"🐛 'which {compiler}' stdout: '{which_result.stdout.strip()}'")
+            # First check if compiler is in PATH; shutil.which only returns executable files
+            compiler_path = shutil.which(compiler, path=path_env or None)
 
-            if which_result.returncode != 0:
+            if compiler_path is None:
                 if is_essential:
                     logger.warning(f"⚠️  {compiler} not found in PATH")
                     return False
@@ -448,20 +565,10 @@ def validate_intel_oneapi_setup() -> bool:
                     logger.info(f"ℹ️  {compiler} not found in PATH (optional)")
                     continue
 
-            compiler_path = which_result.stdout.strip()
             logger.debug(f"🐛 {compiler} found at: {compiler_path}")
 
-            # Check if the binary is executable
-            if not (Path(compiler_path).is_file() and os.access(compiler_path, os.X_OK)):
-                if is_essential:
-                    logger.warning(f"⚠️  {compiler} found but not executable: {compiler_path}")
-                    return False
-                else:
-                    logger.info(f"ℹ️  {compiler} found but not executable (optional): {compiler_path}")
-                    continue
-
             # Test compiler version
-            result = subprocess.run([compiler, "--version"], capture_output=True, text=True, timeout=10)
+            result = subprocess.run([compiler_path, "--version"], capture_output=True, text=True, timeout=10)
 
             logger.debug(f"🐛 '{compiler} --version' return code: {result.returncode}")
             logger.debug(f"🐛 '{compiler} --version' stdout: '{result.stdout.strip()[:100]}...'")
@@ -497,18 +604,28 @@ def validate_intel_oneapi_setup() -> bool:
 def detect_intel_compiler_version() -> str | None:
     """Detect Intel compiler version using icx --version.
 
+    Results are memoized per PATH value, so icx is only run again when PATH changes.
+
     Returns:
         Version string (e.g., "2024.0.0"), or None if detection fails
     """
+    return _detect_intel_compiler_version(os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=4)
+def _detect_intel_compiler_version(path_env: str) -> str | None:
+    """Cached implementation of detect_intel_compiler_version, keyed by the PATH it ran under."""
+    icx_path = shutil.which("icx", path=path_env or None)
+    if icx_path is None:
+        return None
+
     try:
-        version_result = subprocess.run(["icx", "--version"], capture_output=True, text=True, timeout=10)
+        version_result = subprocess.run([icx_path, "--version"], capture_output=True, text=True, timeout=10)
 
         if version_result.returncode == 0:
             version_output = version_result.stdout.strip()
             # Parse version from output like "Intel(R) oneAPI DPC++/C++ Compiler 2024.0.0"
-            import re
-
-            version_match = re.search(r"(\d+\.\d+\.\d+)", version_output)
+            version_match = _INTEL_VERSION_RE.search(version_output)
             if version_match:
                 version = version_match.group(1)
                 logger.debug(f"🐛 Intel compiler version: {version}")
@@ -519,6 +636,32 @@ def detect_intel_compiler_version() -> str | None:
     return None
 
 
+def _invalidate_detections() -> None:
+    """Forget all memoized compiler and NUMA topology detections, e.g. after installing a compiler.
+
+    The on-disk topology cache is kept; validate_numa_topology(refresh=True) also discards it.
+    """
+    for detection in (
+        _detect_gcc_version,
+        _detect_gcc_path,
+        _detect_intel_oneapi_path,
+        _setup_intel_oneapi_environment,
+        _validate_intel_oneapi_setup,
+        _detect_intel_compiler_version,
+        _load_numa_topology,
+    ):
+        detection.cache_clear()
+
+
+def _dir_entries(path: Path) -> dict[str, os.DirEntry[str]]:
+    """Return a directory's entries by name, or an empty dict if it can't be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
 def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     """Generate Intel oneAPI-specific configuration additions.
 
@@ -531,6 +674,16 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     logger.info(f"🔧 Generating Intel oneAPI config additions for: {oneapi_path}")
     config_additions = []
 
+    # Many probes share a parent directory, so list each parent once rather than
+    # stat'ing every candidate path
+    listings: dict[Path, dict[str, os.DirEntry[str]]] = {}
+
+    def exists(path: Path) -> bool:
+        parent = path.parent
+        if parent not in listings:
+            listings[parent] = _dir_entries(parent)
+        return path.name in listings[parent]
+
     # Find the actual compiler paths - try multiple possible locations
     possible_compiler_paths = [
         Path(oneapi_path) / "compiler" / "latest" / "bin",  # Direct bin (newer versions)
@@ -539,20 +692,20 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
 
     # Also check for version-specific paths
     compiler_dir = Path(oneapi_path) / "compiler"
-    if compiler_dir.exists():
-        for version_dir in compiler_dir.iterdir():
-            if version_dir.is_dir() and version_dir.name != "latest":
-                possible_compiler_paths.extend(
-                    [
-                        version_dir / "bin",
-                        version_dir / "linux" / "bin",
-                    ]
-                )
+    for name, entry in _dir_entries(compiler_dir).items():
+        if name != "latest" and entry.is_dir():
+            version_dir = compiler_dir / name
+            possible_compiler_paths.extend(
+                [
+                    version_dir / "bin",
+                    version_dir / "linux" / "bin",
+                ]
+            )
 
     # Find the first path that contains icx
     compiler_base_path = None
     for path in possible_compiler_paths:
-        if (path / "icx").exists():
+        if exists(path / "icx"):
             compiler_base_path = path
             logger.debug(f"🐛 Found compiler path: {compiler_base_path}")
             break
@@ -567,17 +720,21 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     icpx_path = compiler_base_path / "icpx"
     ifx_path = compiler_base_path / "ifx"
 
+    icx_exists = exists(icx_path)
+    icpx_exists = exists(icpx_path)
+    ifx_exists = exists(ifx_path)
+
     logger.debug("🐛 Looking for compilers at:")
-    logger.debug(f"🐛   ICX: {icx_path} (exists: {icx_path.exists()})")
-    logger.debug(f"🐛   ICPX: {icpx_path} (exists: {icpx_path.exists()})")
-    logger.debug(f"🐛   IFX: {ifx_path} (exists: {ifx_path.exists()})")
+    logger.debug(f"🐛   ICX: {icx_path} (exists: {icx_exists})")
+    logger.debug(f"🐛   ICPX: {icpx_path} (exists: {icpx_exists})")
+    logger.debug(f"🐛   IFX: {ifx_path} (exists: {ifx_exists})")
 
     # Use full paths if available, otherwise use simple names (assuming PATH is set)
-    cc_compiler = str(icx_path) if icx_path.exists() else "icx"
-    cxx_compiler = str(icpx_path) if icpx_path.exists() else "icpx"
+    cc_compiler = str(icx_path) if icx_exists else "icx"
+    cxx_compiler = str(icpx_path) if icpx_exists else "icpx"
 
     # Handle Fortran compiler - it might not be installed
-    if ifx_path.exists():
+    if ifx_exists:
         fc_compiler = str(ifx_path)
         logger.info(f"🔧 Using compilers: CC={cc_compiler}, CXX={cxx_compiler}, FC={fc_compiler}")
     else:
@@ -588,10 +745,6 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     # Set Intel compilers for all benchmark suites
     suites = ["intrate", "intspeed", "fprate", "fpspeed"]
 
-    # Get Intel oneAPI environment for additional paths
-    # Note: We call this to ensure environment is set up, but don't use the return value here
-    setup_intel_oneapi_environment(oneapi_path)
-
     # Build library and include paths
     lib_paths = []
     include_paths = []
@@ -614,7 +767,7 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
         standard_lib_paths.extend(version_lib_paths)
 
     for lib_path in standard_lib_paths:
-        if Path(lib_path).exists():
+        if exists(Path(lib_path)):
             lib_paths.append(lib_path)
             logger.debug(f"🐛 Added library path: {lib_path}")
 
@@ -634,7 +787,7 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
         standard_include_paths.extend(version_include_paths)
 
     for include_path in standard_include_paths:
-        if Path(include_path).exists():
+        if exists(Path(include_path)):
             include_paths.append(include_path)
             logger.debug(f"🐛 Added include path: {include_path}")
 
@@ -646,7 +799,7 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     logger.info(f"🔧 Generated CPPFLAGS: {cppflags}")
 
     # Restrict Intel compiler to floating-point suites only due to C++ compatibility issues in integer suites
-    fp_suites = [suite for suite in suites if suite in ["fprate", "fpspeed"]]
+    fp_suites = [suite for suite in suites if suite in _FP_SUITES]
 
     if len(fp_suites) < len(suites):
         excluded_suites = [suite for suite in suites if suite not in fp_suites]
@@ -689,6 +842,123 @@ def generate_intel_config_additions(oneapi_path: str) -> list[str]:
     return config_additions
 
 
+def _available_cpu_count() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Unlike os.cpu_count(), the affinity mask honors taskset and cgroup cpuset
+    limits, so rate runs in a restricted container do not oversubscribe.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 4
+
+
+def _cache_home() -> Path:
+    """Return the per-user specer cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "specer"
+
+
+def _config_cache_dir() -> Path:
+    """Return the per-user directory holding generated config cache entries."""
+    return _cache_home() / "configs"
+
+
+def _config_cache_key(
+    template_content: str,
+    spec_path: str,
+    cores: int | None,
+    tune: str | None,
+    config_add: list[str] | None,
+    compiler: str | None,
+    detections: tuple[str | int | None, ...],
+) -> str:
+    """Compute the cache key for a generated config.
+
+    The key covers the template text, every parameter that affects the rendered
+    config, and the compiler detections it is rendered from, so upgrading or
+    installing a compiler in place invalidates the cached config.
+    """
+    hasher = hashlib.sha256(template_content.encode())
+    inputs = (
+        spec_path,
+        # Rate copies default to the available CPUs when no core count is given
+        cores if cores is not None else _available_cpu_count(),
+        tune,
+        config_add,
+        compiler,
+        detections,
+    )
+    hasher.update(repr(inputs).encode())
+    return hasher.hexdigest()
+
+
+def _config_signature(config_path: Path) -> str:
+    """Identify the current contents of config_path by inode, size and modification time."""
+    st = config_path.stat()
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _lookup_cached_config(cache_key: str) -> str | None:
+    """Return the config path recorded for cache_key, if the file is unchanged since.
+
+    Configs with the same parameters share a file name, so a run with different
+    compiler detections, or SPEC writing its checksums back, changes the file; such
+    an entry is a miss and the config is generated (or reused) the regular way.
+    """
+    try:
+        config_path, signature = (_config_cache_dir() / cache_key).read_text().split("\n")
+        if _config_signature(Path(config_path)) == signature:
+            return config_path
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _store_cached_config(cache_key: str, config_path: Path) -> None:
+    """Record config_path and its current signature under cache_key, replacing the entry atomically."""
+    cache_dir = _config_cache_dir()
+    tmp_entry = cache_dir / f".{cache_key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_entry.write_text(f"{config_path.absolute()}\n{_config_signature(config_path)}")
+        tmp_entry.replace(cache_dir / cache_key)
+    except OSError as e:
+        logger.debug(f"🐛 Could not cache generated config: {e}")
+
+
+# The template's gcc_dir define; only its first occurrence (the main one) is edited
+_GCC_DIR_LINE = '%   define  gcc_dir        "/opt/rh/devtoolset-9/root/usr"  # EDIT (see above)'
+
+
+def _apply_template_edits(template_content: str, edits: dict[str, str]) -> str:
+    """Replace literal template lines in a single pass.
+
+    Every occurrence of each key in edits is replaced by its value, except for the
+    gcc_dir define, where only the first occurrence is.
+
+    Args:
+        template_content: Config template text
+        edits: Mapping of template lines to their replacements
+
+    Returns:
+        The edited template text
+    """
+    if not edits:
+        return template_content
+
+    pending = dict(edits)
+
+    def replace(match: re.Match[str]) -> str:
+        line = match[0]
+        new_line = pending[line]
+        if line == _GCC_DIR_LINE:
+            pending[line] = line
+        return new_line
+
+    return re.compile("|".join(map(re.escape, edits))).sub(replace, template_content)
+
+
 def generate_config_from_template(
     cores: int | None = None,
     spec_root: Path | None = None,
@@ -731,10 +1001,28 @@ def generate_config_from_template(
         # Read the template content
         template_content = template_path.read_text()
 
+        # Compiler detections the rendered config depends on; they are memoized, so
+        # the template editing below reuses them
+        detections = (
+            detect_intel_oneapi_path() if compiler is None or compiler in _INTEL_COMPILERS else None,
+            detect_gcc_path(),
+            detect_gcc_version(),
+        )
+
+        # Reuse the config generated for identical inputs, skipping template editing
+        cache_key = _config_cache_key(template_content, spec_path, cores, tune, config_add, compiler, detections)
+        cached_config = _lookup_cached_config(cache_key)
+        if cached_config:
+            logger.debug(f"🐛 Reusing cached config: {cached_config}")
+            return cached_config
+
+        # Literal template line edits, applied together in a single pass over the
+        # template once all of them are known
+        edits: dict[str, str] = {}
+
         # Update label to "specer"
-        template_content = template_content.replace(
-            '%   define label "mytest"           # (2)      Use a label meaningful to *you*.',
-            '%   define label "specer"           # (2)      Use a label meaningful to *you*.',
+        edits['%   define label "mytest"           # (2)      Use a label meaningful to *you*.'] = (
+            '%   define label "specer"           # (2)      Use a label meaningful to *you*.'
         )
 
         # Determine which compiler to use
@@ -755,7 +1043,7 @@ def generate_config_from_template(
                 logger.warning("⚠️  No compiler detected, using GCC template as fallback")
 
         # Handle Intel oneAPI compiler configuration
-        if effective_compiler in ["intel", "oneapi"]:
+        if effective_compiler in _INTEL_COMPILERS:
             oneapi_path = detect_intel_oneapi_path()
             if oneapi_path:
                 logger.info(f"🔧 Configuring Intel oneAPI at: {oneapi_path}")
@@ -780,7 +1068,7 @@ def generate_config_from_template(
                     logger.warning("⚠️  Failed to set up Intel oneAPI environment, falling back to GCC")
                     effective_compiler = "gcc"
 
-                if effective_compiler in ["intel", "oneapi"]:
+                if effective_compiler in _INTEL_COMPILERS:
                     # Generate Intel-specific config additions
                     intel_additions = generate_intel_config_additions(oneapi_path)
 
@@ -796,38 +1084,48 @@ def generate_config_from_template(
 
         # Handle GCC compiler configuration (default behavior)
         if effective_compiler == "gcc":
-            # Auto-detect GCC version and uncomment GCCge10 if needed
-            gcc_version = detect_gcc_version()
+            # Auto-detect GCC version and uncomment GCCge10 if needed; skip detection
+            # entirely when the template has no such line to edit
+            old_line = "#%define GCCge10  # EDIT: remove the '#' from column 1 if using GCC 10 or later"
+            gcc_version = detect_gcc_version() if old_line in template_content else None
             if gcc_version and gcc_version >= 10:
                 # Uncomment the GCCge10 define for GCC 10+
-                old_line = "#%define GCCge10  # EDIT: remove the '#' from column 1 if using GCC 10 or later"
                 new_line = (
                     "%define GCCge10  # EDIT: remove the '#' from column 1 if using GCC 10 or later (auto-detected)"
                 )
-                template_content = template_content.replace(old_line, new_line)
-
-            # Auto-detect GCC path and update gcc_dir
-            gcc_path = detect_gcc_path()
-            if gcc_path:
-                logger.debug(f"🐛 Detected GCC path: {gcc_path}")
-                # Replace the gcc_dir define (this handles both the main and conditional cases)
-                old_line = '%   define  gcc_dir        "/opt/rh/devtoolset-9/root/usr"  # EDIT (see above)'
-                new_line = f'%   define  gcc_dir        "{gcc_path}"  # EDIT (see above) (auto-detected)'
-                template_content = template_content.replace(old_line, new_line, 1)
-                logger.debug("🐛 Updated GCC directory in config template")
-            else:
-                logger.warning("⚠️  Could not detect GCC path, using default in template")
+                edits[old_line] = new_line
+
+            # Auto-detect GCC path and update gcc_dir, again only if the template has it
+            if _GCC_DIR_LINE in template_content:
+                gcc_path = detect_gcc_path()
+                if gcc_path:
+                    logger.debug(f"🐛 Detected GCC path: {gcc_path}")
+                    # Replace the gcc_dir define (this handles both the main and conditional cases)
+                    new_line = f'%   define  gcc_dir        "{gcc_path}"  # EDIT (see above) (auto-detected)'
+                    edits[_GCC_DIR_LINE] = new_line
+                    logger.debug("🐛 Updated GCC directory in config template")
+                else:
+                    logger.warning("⚠️  Could not detect GCC path, using default in template")
 
         # Update tune setting based on CLI parameter
         if tune is not None:
             # Map tune values and update the tune line
             tune_mapping = {"base": "base", "peak": "peak", "all": "base,peak"}
             tune_value = tune_mapping.get(tune, tune)  # Use mapping or original value
-            template_content = template_content.replace(
-                'tune                 = base,peak  # EDIT if needed: set to "base" for old GCC.',
-                f'tune                 = {tune_value}  # EDIT if needed: set to "base" for old GCC. (auto-set)',
+            edits['tune                 = base,peak  # EDIT if needed: set to "base" for old GCC.'] = (
+                f'tune                 = {tune_value}  # EDIT if needed: set to "base" for old GCC. (auto-set)'
             )
 
+        # Modify the copies value for rate benchmarks
+        # Find the line with "copies = 1" and replace it in the intrate,fprate section,
+        # defaulting to a reasonable number if not specified
+        copies = cores if cores is not None else _available_cpu_count()
+        edits["   copies           = 1   # EDIT to change number of copies (see above)"] = (
+            f"   copies           = {copies}   # EDIT to change number of copies (see above)"
+        )
+
+        template_content = _apply_template_edits(template_content, edits)
+
         # Process custom config additions
         if config_add:
             for addition in config_add:
@@ -897,26 +1195,8 @@ def generate_config_from_template(
                     logger.warning(f"⚠️  Error processing config addition '{addition}': {e}")
                     continue
 
-        # Modify the copies value for rate benchmarks
-        # Find the line with "copies = 1" and replace it
-        if cores is not None:
-            # Replace the copies line in the intrate,fprate section
-            template_content = template_content.replace(
-                "   copies           = 1   # EDIT to change number of copies (see above)",
-                f"   copies           = {cores}   # EDIT to change number of copies (see above)",
-            )
-        else:
-            # Default to a reasonable number if not specified
-            default_cores = os.cpu_count() or 4
-            template_content = template_content.replace(
-                "   copies           = 1   # EDIT to change number of copies (see above)",
-                f"   copies           = {default_cores}   # EDIT to change number of copies (see above)",
-            )
-
         # Create a deterministic config file name based on parameters
         # This ensures the same parameters always generate the same config file name
-        import hashlib
-
         # Create a hash based on the key parameters that affect compilation
         param_string = f"cores:{cores}_tune:{tune}_compiler:{effective_compiler}"
         if config_add:
@@ -942,11 +1222,22 @@ def generate_config_from_template(
             ):
                 # This config has been used for compilation before, reuse it
                 logger.debug(f"🐛 Reusing existing config with checksums: {config_path}")
+                _store_cached_config(cache_key, config_path)
                 return str(config_path)
 
-        # Write the new config file (SPEC will add checksums after compilation)
-        config_path.write_text(template_content)
+            # Identical content from an earlier run needs no rewrite
+            if existing_content == template_content:
+                logger.debug(f"🐛 Reusing identical config file: {config_path}")
+                _store_cached_config(cache_key, config_path)
+                return str(config_path)
+
+        # Write the new config file (SPEC will add checksums after compilation);
+        # go through a temporary file so concurrent runs never see a partial config
+        tmp_path = config_path.with_name(f".{config_filename}.{os.getpid()}.tmp")
+        tmp_path.write_text(template_content)
+        tmp_path.replace(config_path)
         logger.debug(f"🐛 Created new config file: {config_path}")
+        _store_cached_config(cache_key, config_path)
         return str(config_path)
 
     except Exception:
@@ -980,85 +1271,52 @@ def build_runcpu_command(
         if not runcpu_path.exists():
             typer.echo(f"Error: runcpu not found at {runcpu_path}", err=True)
             raise typer.Exit(1)
-        cmd = [str(runcpu_path)]
+        runcpu = str(runcpu_path)
     else:
         # Assume runcpu is in PATH
-        cmd = ["runcpu"]
-
-    # Handle update action specially
-    if action == "update":
-        cmd.append("--update")
-    else:
-        # Add action and config for normal commands
-        cmd.extend(["--action", action])
-
-        # Add config
-        cmd.extend(["--config", config])
-
-    # Add tuning level
-    if tune:
-        cmd.extend(["--tune", tune])
-
-    # Add size (for run command)
-    if size:
-        cmd.extend(["--size", size])
-
-    # Add copies (for rate benchmarks)
-    if copies is not None:
-        cmd.extend(["--copies", str(copies)])
-
-    # Add threads (for speed benchmarks)
-    if threads is not None:
-        cmd.extend(["--threads", str(threads)])
-
-    # Add iterations
-    if iterations is not None:
-        cmd.extend(["--iterations", str(iterations)])
-
-    # Add reportable/noreportable
-    if reportable:
-        cmd.append("--reportable")
-    elif noreportable:
-        cmd.append("--noreportable")
-
-    # Add output formats (default to rsf,pdf for speed, allow all for compatibility)
-    # IMPORTANT: Must come before --verbose since --verbose can take a numeric parameter
-    if output_formats is not None:
-        if output_formats.lower() == "all":
-            # Use SPEC default (all formats: rsf, html, pdf, txt, ps)
-            pass  # Don't add --output_format to use SPEC defaults
-        else:
-            # Use specified formats
-            cmd.extend(["--output_format", output_formats])
-    else:
-        # Default: only rsf and pdf for speed and efficiency
-        cmd.extend(["--output_format", "rsf,pdf"])
-
-    # Add verbose (must be after --output_format to avoid conflicts)
-    if verbose:
-        cmd.append("--verbose=5")  # Use verbosity level 5 for detailed output
-
-    # Add rebuild
-    if rebuild:
-        cmd.append("--rebuild")
-
-    # Add parallel test
-    if parallel_test is not None:
-        cmd.extend(["--parallel_test", str(parallel_test)])
-
-    # Add ignore errors
-    if ignore_errors:
-        cmd.append("--ignore_errors")
-
-    # Add nobuild flag
-    if nobuild:
-        cmd.append("--nobuild")
-
-    # Add benchmarks (skip for update action)
-    if action != "update":
-        cmd.extend(benchmarks)
-
-    return cmd
+        runcpu = "runcpu"
+
+    # Output formats default to only rsf and pdf for speed and efficiency; "all" leaves
+    # out --output_format to use the SPEC defaults (rsf, html, pdf, txt, ps)
+    if output_formats is None:
+        output_formats = "rsf,pdf"
+    elif output_formats.lower() == "all":
+        output_formats = None
+
+    # Assemble every option in one list display instead of growing the list piecemeal
+    return [
+        runcpu,
+        # Handle update action specially; normal commands take an action and config
+        *(("--update",) if action == "update" else ("--action", action, "--config", config)),
+        # Add tuning level
+        *(("--tune", tune) if tune else ()),
+        # Add size (for run command)
+        *(("--size", size) if size else ()),
+        # Add copies (for rate benchmarks)
+        *(("--copies", str(copies)) if copies is not None else ()),
+        # Add threads (for speed benchmarks)
+        *(("--threads", str(threads)) if threads is not None else ()),
+        # Add iterations
+        *(("--iterations", str(iterations)) if iterations is not None else ()),
+        # Add reportable/noreportable
+        *(("--reportable",) if reportable else ("--noreportable",) if noreportable else ()),
+        # Add output formats
+        # IMPORTANT: Must come before --verbose since --verbose can take a numeric parameter
+        *(("--output_format", output_formats) if output_formats is not None else ()),
+        # Add verbose (must be after --output_format to avoid conflicts); use
+        # verbosity level 5 for detailed output
+        *(("--verbose=5",) if verbose else ()),
+        # Add rebuild
+        *(("--rebuild",) if rebuild else ()),
+        # Add parallel test
+        *(("--parallel_test", str(parallel_test)) if parallel_test is not None else ()),
+        # Add ignore errors
+        *(("--ignore_errors",) if ignore_errors else ()),
+        # Add nobuild flag
+        *(("--nobuild",) if nobuild else ()),
+        # Add benchmarks (skip for update action)
+        *(benchmarks if action != "update" else ()),
+    ]
 
 
 def check_benchmarks_compiled(
@@ -1085,7 +1343,7 @@ def check_benchmarks_compiled(
 
     for benchmark in benchmarks:
         # Skip suite names that aren't individual benchmarks
-        if benchmark.lower() in {"intspeed", "intrate", "fpspeed", "fprate", "all", "specspeed", "specrate"}:
+        if benchmark.lower() in _SUITE_NAMES:
             continue
 
         # Check if the benchmark executable exists in the expected location
@@ -1115,14 +1373,83 @@ def check_benchmarks_compiled(
     return compilation_status
 
 
-def validate_numa_topology() -> dict[str, Any] | None:
+def validate_numa_topology(refresh: bool = False) -> dict[str, Any] | None:
     """Validate NUMA topology and return available nodes and CPUs.
 
+    The topology is detected once per boot and CPU hotplug state and cached on
+    disk and per process, so later calls and invocations do not have to run
+    numactl again.
+
+    Args:
+        refresh: Discard any cached topology and detect it again
+
     Returns:
         Dictionary with NUMA topology information, or None if NUMA not available
     """
+    if refresh:
+        _load_numa_topology.cache_clear()
+        with contextlib.suppress(OSError):
+            (_cache_home() / "topology.json").unlink()
+    topology = _load_numa_topology()
+    if topology is None:
+        return None
+    # Hand out a copy so callers cannot mutate the per-process cached entry
+    return {
+        "nodes": list(topology["nodes"]),
+        "node_cpus": {node: list(cpus) for node, cpus in topology["node_cpus"].items()},
+        "total_cpus": topology["total_cpus"],
+    }
+
+
+def _topology_cache_key() -> str:
+    """Compute a key that changes whenever the NUMA topology could have changed."""
+    hasher = hashlib.sha256(os.uname().release.encode())
+    for source in _TOPOLOGY_CACHE_SOURCES:
+        with contextlib.suppress(OSError):
+            hasher.update(source.read_bytes())
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _load_numa_topology() -> dict[str, Any] | None:
+    """Return the NUMA topology from the on-disk cache, detecting it on a miss."""
+    import json
+
+    cache_file = _cache_home() / "topology.json"
+    cache_key = _topology_cache_key()
+    try:
+        cached = json.loads(cache_file.read_text())
+        if cached["key"] == cache_key:
+            topology: dict[str, Any] = cached["topology"]
+            # JSON object keys are strings; restore the integer node ids
+            topology["node_cpus"] = {int(node): cpus for node, cpus in topology["node_cpus"].items()}
+            return topology
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    detected = _detect_numa_topology()
+    if detected is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f".topology.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps({"key": cache_key, "topology": detected}))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.debug(f"🐛 Could not cache NUMA topology: {e}")
+    return detected
+
+
+def _detect_numa_topology() -> dict[str, Any] | None:
+    """Detect the NUMA topology from sysfs, falling back to 'numactl --hardware'."""
+    sysfs_topology = _read_sysfs_numa_topology()
+    if sysfs_topology is not None:
+        return sysfs_topology
+
     # Try to get NUMA topology using numactl --hardware
-    result = subprocess.run(["numactl", "--hardware"], capture_output=True, text=True, timeout=10)
+    try:
+        result = subprocess.run(["numactl", "--hardware"], capture_output=True, text=True, timeout=10)
+    except FileNotFoundError:
+        return None
 
     if result.returncode != 0:
         return None
@@ -1131,29 +1458,63 @@ def validate_numa_topology() -> dict[str, Any] | None:
     nodes_list: list[int] = topology["nodes"]
     node_cpus_dict: dict[int, list[int]] = topology["node_cpus"]
 
-    lines = result.stdout.strip().split("\n")
-
-    for line in lines:
-        line = line.strip()
-        if line.startswith("node ") and " cpus:" in line:
-            # Parse line like "node 0 cpus: 0 1 2 3 4 5"
-            parts = line.split()
-            if len(parts) >= 3 and parts[1].isdigit():
-                node_id = int(parts[1])
-                nodes_list.append(node_id)
-                cpu_list: list[int] = []
-                # Extract CPU numbers after "cpus:"
-                cpus_start = False
-                for part in parts:
-                    if cpus_start and part.isdigit():
-                        cpu_list.append(int(part))
-                    elif part == "cpus:":
-                        cpus_start = True
-                node_cpus_dict[node_id] = cpu_list
-                if cpu_list:
-                    topology["total_cpus"] = max(topology["total_cpus"], max(cpu_list) + 1)
-
-    return topology if nodes_list else None
+    for match in _NUMACTL_NODE_CPUS.finditer(result.stdout):
+        node_id = int(match[1])
+        nodes_list.append(node_id)
+        node_cpus_dict[node_id] = [int(cpu) for cpu in match[2].split() if cpu.isdigit()]
+
+    if not nodes_list:
+        return None
+
+    topology["total_cpus"] = max((max(cpus) + 1 for cpus in node_cpus_dict.values() if cpus), default=0)
+    return topology
+
+
+def _read_sysfs_numa_topology() -> dict[str, Any] | None:
+    """Read the NUMA topology from /sys/devices/system/node, if the kernel exposes it."""
+    try:
+        node_dirs = [(int(node_dir.name[4:]), node_dir) for node_dir in _SYSFS_NODE_DIR.glob("node[0-9]*")]
+        node_cpus = {node_id: _parse_cpulist((node_dir / "cpulist").read_text()) for node_id, node_dir in node_dirs}
+    except (OSError, ValueError):
+        return None
+
+    if not node_cpus:
+        return None
+
+    nodes = sorted(node_cpus)
+    all_cpus = [cpu for cpus in node_cpus.values() for cpu in cpus]
+    return {
+        "nodes": nodes,
+        "node_cpus": {node_id: node_cpus[node_id] for node_id in nodes},
+        "total_cpus": max(all_cpus) + 1 if all_cpus else 0,
+    }
+
+
+def _parse_cpulist(cpulist: str) -> list[int]:
+    """Expand a kernel CPU list such as '0-11,48-59' into individual CPU ids."""
+    cpus: list[int] = []
+    # int() ignores surrounding whitespace, so the trailing newline from sysfs needs
+    # no separate strip pass
+    for part in cpulist.split(","):
+        if not part or part.isspace():
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def is_valid_cpu_list(cpu_cores: str) -> bool:
+    """Check that a --cpu-cores value looks like a CPU list such as '0-3,8-11'.
+
+    Only the format is checked; numactl/taskset reject CPUs that don't exist.
+
+    Args:
+        cpu_cores: CPU list given on the command line
+
+    Returns:
+        True if the value only contains CPU numbers, ranges and list separators
+    """
+    return cpu_cores.translate(_CPU_LIST_SEPARATORS).isdigit() or _CPU_LIST_PATTERN.match(cpu_cores) is not None
 
 
 def build_affinity_command(
@@ -1177,14 +1538,7 @@ def build_affinity_command(
         return base_cmd
 
     # Prefer numactl for comprehensive NUMA management
-    try:
-        # Check if numactl is available
-        subprocess.run(["numactl", "--version"], capture_output=True, check=True)
-        use_numactl = True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        use_numactl = False
-
-    if use_numactl:
+    if _has_command("numactl"):
         # Use numactl for both NUMA node and CPU core binding
         affinity_cmd = ["numactl"]
 
@@ -1202,20 +1556,24 @@ def build_affinity_command(
 
     elif cpu_cores:
         # Fall back to taskset for CPU binding only
-        try:
-            subprocess.run(["taskset", "--version"], capture_output=True, check=True)
+        if _has_command("taskset"):
             return ["taskset", "-c", cpu_cores] + base_cmd
-        except (subprocess.SubprocessError, FileNotFoundError):
-            # No affinity tools available, return original command
-            typer.echo(
-                "Warning: Neither numactl nor taskset available for CPU affinity",
-                err=True,
-            )
-            return base_cmd
+
+        # No affinity tools available, return original command
+        typer.echo(
+            "Warning: Neither numactl nor taskset available for CPU affinity",
+            err=True,
+        )
 
     return base_cmd
 
 
+@lru_cache(maxsize=8)
+def _has_command(name: str) -> bool:
+    """Return whether an executable is on PATH, checked once per process without spawning it."""
+    return shutil.which(name) is not None
+
+
 def parse_benchmark_from_output(line: str) -> str | None:
     """Parse benchmark name from SPEC output line.
 
@@ -1225,22 +1583,69 @@ def parse_benchmark_from_output(line: str) -> str | None:
     Returns:
         Benchmark name if found, None otherwise
     """
-    # Common patterns in SPEC output
-    patterns = [
-        r"Running.*?(\d{3}\.\w+(?:_[rs])?)",  # "Running 500.perlbench_r"
-        r"Building.*?(\d{3}\.\w+(?:_[rs])?)",  # "Building 502.gcc_r"
-        r"(\d{3}\.\w+(?:_[rs])?)\s*(?:base|peak)",  # "500.perlbench_r base"
-        r"runcpu.*?(\d{3}\.\w+(?:_[rs])?)",  # "runcpu ... 519.lbm_r"
-        r"specinvoke.*?(\d{3}\.\w+(?:_[rs])?)",  # "specinvoke ... 525.x264_r"
-        r"^(\d{3}\.\w+(?:_[rs])?):\s",  # "500.perlbench_r: "
-    ]
+    # Every benchmark id contains a ".", so most lines can skip the regex engine
+    if "." not in line:
+        return None
+    match = _BENCH_PATTERN.search(line)
+    return match[match.lastindex] if match and match.lastindex else None
 
-    for pattern in patterns:
-        match = re.search(pattern, line, re.IGNORECASE)
-        if match:
-            return match.group(1)
 
-    return None
+def _last_benchmark_in(lines: bytes) -> str | None:
+    """Return the benchmark named last in a chunk of complete SPEC output lines.
+
+    Args:
+        lines: Raw runcpu output ending at a line boundary
+
+    Returns:
+        Benchmark name if found, None otherwise
+    """
+    detected = None
+    for match in _BENCH_PATTERN_BYTES.finditer(lines):
+        detected = match[match.lastindex or 0]
+    return detected.decode() if detected else None
+
+
+def iter_output_lines(fd: int) -> Iterator[list[str]]:
+    """Yield the decoded output lines from a pipe or pty as they become complete.
+
+    Reads whatever is available in large chunks rather than one line per call and
+    yields all lines completed by each read together, so bursts of output cost one
+    syscall and one console write instead of one per line.
+    """
+    buffer = b""
+    while True:
+        try:
+            chunk = os.read(fd, _OUTPUT_CHUNK_SIZE)
+        except OSError as e:
+            # Linux reports EIO on a pty master once the child side has closed
+            if e.errno != errno.EIO:
+                raise
+            chunk = b""
+        if not chunk:
+            break
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        if lines:
+            yield [line.decode(errors="replace").rstrip() for line in lines]
+    if buffer:
+        yield [buffer.decode(errors="replace").rstrip()]
+
+
+def _spawn_kwargs(cmd: list[str]) -> dict[str, Any]:
+    """Return subprocess keyword arguments that keep runcpu on the posix_spawn fast path.
+
+    CPython only launches children via posix_spawn when close_fds is False and the
+    executable includes a directory component; otherwise it falls back to fork+exec.
+    Descriptors opened by Python are non-inheritable (PEP 446), so disabling
+    close_fds does not leak them into runcpu. Affinity is applied through the
+    numactl/taskset wrapper rather than a preexec_fn, which would also force fork.
+
+    Args:
+        cmd: Command to execute
+
+    Returns:
+        Keyword arguments for subprocess.run/subprocess.Popen
+    """
+    return {"close_fds": False, "executable": shutil.which(cmd[0]) or cmd[0]}
 
 
 def execute_runcpu(
@@ -1283,44 +1688,66 @@ def execute_runcpu(
         if parse_results or hide_logs:
             # Capture output for parsing or when hiding logs
             if hide_logs and show_progress:
+                from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
                     TimeElapsedColumn(),
                     transient=True,
+                    # Draw on stderr so piped stdout stays clean, and not at all when
+                    # stderr is not a terminal
+                    console=Console(stderr=True),
+                    disable=not sys.stderr.isatty(),
                 ) as progress:
                     task = progress.add_task(description="Running SPEC benchmarks...", total=None)
 
-                    # Use Popen for real-time output monitoring
+                    # Use Popen for real-time output monitoring; output is read as raw
+                    # bytes in large chunks rather than decoded line by line
                     process = subprocess.Popen(
                         final_cmd,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.STDOUT,
-                        text=True,
-                        universal_newlines=True,
-                        bufsize=1,
+                        bufsize=0,
+                        **_spawn_kwargs(final_cmd),
                     )
 
-                    current_benchmark = None
-                    output_lines = []
-
-                    # Monitor output in real-time
-                    if process.stdout:
-                        for line in iter(process.stdout.readline, ""):
-                            output_lines.append(line)
-
-                            # Try to detect current benchmark
-                            detected_benchmark = parse_benchmark_from_output(line)
-                            if detected_benchmark and detected_benchmark != current_benchmark:
-                                current_benchmark = detected_benchmark
-                                progress.update(task, description=f"Running {current_benchmark}...")
-
-                    # Wait for process to complete
-                    process.wait()
+                    current_benchmark = shown_benchmark = None
+                    next_update = 0.0
+                    with tempfile.SpooledTemporaryFile(max_size=_OUTPUT_SPOOL_SIZE) as spool:
+                        # Monitor output in real-time
+                        if process.stdout:
+                            fd = process.stdout.fileno()
+                            partial = b""
+                            while chunk := os.read(fd, _OUTPUT_CHUNK_SIZE):
+                                spool.write(chunk)
+
+                                # Try to detect current benchmark in the complete lines
+                                data = partial + chunk
+                                cut = data.rfind(b"\n") + 1
+                                partial = data[cut:]
+                                detected_benchmark = _last_benchmark_in(data[:cut])
+                                if detected_benchmark:
+                                    current_benchmark = detected_benchmark
+
+                                # Coalesce spinner updates to at most one per interval
+                                if current_benchmark != shown_benchmark and (now := time.monotonic()) >= next_update:
+                                    shown_benchmark = current_benchmark
+                                    next_update = now + _PROGRESS_UPDATE_INTERVAL
+                                    progress.update(task, description=f"Running {current_benchmark}...")
+
+                        # Wait for process to complete
+                        process.wait()
+
+                        # Only decode the captured output when something will read it
+                        stdout = ""
+                        if parse_results or verbose:
+                            spool.seek(0)
+                            stdout = spool.read().decode("utf-8", errors="replace")
 
                     result = ProcessResult(
                         returncode=process.returncode,
-                        stdout="".join(output_lines),
+                        stdout=stdout,
                         stderr="",
                     )
             else:
@@ -1329,6 +1756,7 @@ def execute_runcpu(
                     check=False,
                     text=True,
                     capture_output=True,
+                    **_spawn_kwargs(final_cmd),
                 )
                 result = ProcessResult(
                     returncode=subprocess_result.returncode,
@@ -1351,6 +1779,7 @@ def execute_runcpu(
                 check=False,
                 text=True,
                 capture_output=False,
+                **_spawn_kwargs(final_cmd),
             )
             result = ProcessResult(returncode=subprocess_result.returncode, stdout="", stderr="")
             output = ""
@@ -1381,6 +1810,75 @@ def execute_runcpu(
         raise typer.Exit(130) from err
 
 
+# Benchmark table columns after name and status: measurements are only shown when
+# numeric, counts whenever present
+_BENCH_MEASUREMENT_FIELDS = (("ratio", "{:.2f}".format), ("time", "{:.1f}".format), ("reference", "{:.0f}".format))
+_BENCH_COUNT_FIELDS = ("copies", "threads")
+_BENCH_ROW_UNAVAILABLE = ["N/A"] * (len(_BENCH_MEASUREMENT_FIELDS) + len(_BENCH_COUNT_FIELDS))
+
+# Status cell markup for benchmarks that ran cleanly, were flagged by SPEC, or failed
+_STATUS_SUCCESS = "[green]Success[/green]"
+_STATUS_WARNING = "[yellow]Warning[/yellow]"
+_STATUS_FAILED = "[red]Failed[/red]"
+
+# (header, style, justify, width) for each benchmark table column
+_BENCH_COLUMNS: tuple[tuple[str, str, JustifyMethod, int], ...] = (
+    ("Benchmark", "cyan", "left", 18),
+    ("Status", "yellow", "left", 10),
+    ("Ratio", "green", "right", 8),
+    ("Time (s)", "blue", "right", 8),
+    ("Reference", "magenta", "right", 9),
+    ("Copies", "white", "center", 7),
+    ("Threads", "white", "center", 8),
+)
+
+# Above this many rows Rich's per-cell measurement dominates rendering time, so
+# large tables are printed as aligned plain text instead
+_PLAIN_TABLE_MIN_ROWS = 200
+
+# A run produces only a handful of result files, too few to be worth a Rich table
+_FILE_LIST_MAX_ROWS = 10
+
+
+def _print_plain_table(
+    console: Console,
+    title: str,
+    columns: tuple[tuple[str, str, JustifyMethod, int], ...],
+    rows: list[tuple[str, ...]],
+) -> None:
+    """Print a table as aligned plain text, without Rich's per-cell layout.
+
+    Column widths are computed once over all rows; styles and markup are dropped.
+    """
+    from rich.markup import render
+
+    plain: dict[str, str] = {}
+
+    def strip_markup(cell: str) -> str:
+        if "[" not in cell:
+            return cell
+        if cell not in plain:
+            plain[cell] = render(cell).plain
+        return plain[cell]
+
+    cells = [[strip_markup(cell) for cell in row] for row in rows]
+    headers = [header for header, _, _, _ in columns]
+    widths = [
+        max(len(header), *map(len, column)) for header, column in zip(headers, zip(*cells, strict=True), strict=True)
+    ]
+    align = {"left": str.ljust, "right": str.rjust, "center": str.center}
+    justifiers = [align.get(justify, str.ljust) for _, _, justify, _ in columns]
+
+    def format_line(line: list[str]) -> str:
+        return "  ".join(
+            justify(cell, width) for justify, cell, width in zip(justifiers, line, widths, strict=True)
+        ).rstrip()
+
+    lines = [title, format_line(headers), "  ".join("-" * width for width in widths)]
+    lines.extend(map(format_line, cells))
+    console.out("\n".join(lines), highlight=False)
+
+
 def display_results_with_rich(
     result_info: dict[str, Any],
     console: Console | None = None,
@@ -1393,8 +1891,11 @@ def display_results_with_rich(
         console: Rich console instance (uses specer console if None)
         show_timing: Whether to display execution timing information
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
     if console is None:
-        console = Console()
+        console = get_console()
 
     # Create main results panel
     console.print()
@@ -1431,59 +1932,63 @@ def display_results_with_rich(
 
     # Display individual benchmark results
     if result_info.get("benchmark_results"):
-        bench_table = Table(title="🔬 Individual Benchmark Results", show_header=True)
-        bench_table.add_column("Benchmark", style="cyan", width=18)
-        bench_table.add_column("Status", style="yellow", width=10)
-        bench_table.add_column("Ratio", style="green", justify="right", width=8)
-        bench_table.add_column("Time (s)", style="blue", justify="right", width=8)
-        bench_table.add_column("Reference", style="magenta", justify="right", width=9)
-        bench_table.add_column("Copies", style="white", justify="center", width=7)
-        bench_table.add_column("Threads", style="white", justify="center", width=8)
-
+        rows: list[tuple[str, ...]] = []
+        # Bind per-row lookups once for the loop
+        append = rows.append
+        number_types = (int, float)
+        measurement_fields = _BENCH_MEASUREMENT_FIELDS
+        count_fields = _BENCH_COUNT_FIELDS
         for benchmark, data in result_info["benchmark_results"].items():
+            get = data.get
             # Check if benchmark failed
-            if data.get("status") == "failed":
-                status = "[red]Failed[/red]"
-                ratio = "N/A"
-                time = "N/A"
-                reference = "N/A"
-                copies = "N/A"
-                threads = "N/A"
-            elif data.get("warning"):
-                # Has results but SPEC flagged it
-                status = "[yellow]Warning[/yellow]"
-                ratio = f"{data.get('ratio', 'N/A'):.2f}" if isinstance(data.get("ratio"), int | float) else "N/A"
-                time = f"{data.get('time', 'N/A'):.1f}" if isinstance(data.get("time"), int | float) else "N/A"
-                reference = (
-                    f"{data.get('reference', 'N/A'):.0f}" if isinstance(data.get("reference"), int | float) else "N/A"
-                )
-                copies = f"{data.get('copies', 'N/A')}" if data.get("copies") is not None else "N/A"
-                threads = f"{data.get('threads', 'N/A')}" if data.get("threads") is not None else "N/A"
+            if get("status") == "failed":
+                status = _STATUS_FAILED
+                values = _BENCH_ROW_UNAVAILABLE
             else:
-                status = "[green]Success[/green]"
-                ratio = f"{data.get('ratio', 'N/A'):.2f}" if isinstance(data.get("ratio"), int | float) else "N/A"
-                time = f"{data.get('time', 'N/A'):.1f}" if isinstance(data.get("time"), int | float) else "N/A"
-                reference = (
-                    f"{data.get('reference', 'N/A'):.0f}" if isinstance(data.get("reference"), int | float) else "N/A"
-                )
-                copies = f"{data.get('copies', 'N/A')}" if data.get("copies") is not None else "N/A"
-                threads = f"{data.get('threads', 'N/A')}" if data.get("threads") is not None else "N/A"
+                # Has results, possibly flagged by SPEC
+                status = _STATUS_WARNING if get("warning") else _STATUS_SUCCESS
+                values = [
+                    fmt(value) if isinstance(value := get(key), number_types) else "N/A"
+                    for key, fmt in measurement_fields
+                ]
+                values += ["N/A" if (value := get(key)) is None else str(value) for key in count_fields]
 
-            bench_table.add_row(benchmark, status, ratio, time, reference, copies, threads)
+            append((benchmark, status, *values))
 
-        console.print(bench_table)
+        title = "🔬 Individual Benchmark Results"
+        if len(rows) > _PLAIN_TABLE_MIN_ROWS:
+            _print_plain_table(console, title, _BENCH_COLUMNS, rows)
+        else:
+            bench_table = Table(title=title, show_header=True)
+            for header, style, justify, width in _BENCH_COLUMNS:
+                bench_table.add_column(header, style=style, justify=justify, width=width)
+            add_row = bench_table.add_row
+            for row in rows:
+                add_row(*row)
+            console.print(bench_table)
         console.print()
 
     # Display result files
-    if result_info.get("result_files"):
-        files_table = Table(title="📄 Result Files", show_header=True)
-        files_table.add_column("File Path", style="cyan")
-        files_table.add_column("Type", style="magenta")
+    if files := result_info.get("result_files"):
+        if len(files) <= _FILE_LIST_MAX_ROWS:
+            from rich.markup import escape
+
+            width = max(len(file_info["path"]) for file_info in files)
+            lines = ["[italic]📄 Result Files[/italic]"]
+            lines.extend(
+                f"[cyan]{escape(file_info['path'].ljust(width))}[/cyan]  [magenta]{escape(file_info['type'])}[/magenta]"
+                for file_info in files
+            )
+            console.print("\n".join(lines), highlight=False)
+        else:
+            files_table = Table(title="📄 Result Files", show_header=True)
+            files_table.add_column("File Path", style="cyan")
+            files_table.add_column("Type", style="magenta")
 
-        for file_info in result_info["result_files"]:
-            files_table.add_row(file_info["path"], file_info["type"])
+            for file_info in files:
+                files_table.add_row(file_info["path"], file_info["type"])
 
-        console.print(files_table)
+            console.print(files_table)
         console.print()
 
     # Display log file location
@@ -1498,8 +2003,8 @@ def display_results_with_rich(
     # Display execution timing if available and requested
     if show_timing and result_info.get("execution_time"):
         elapsed_time = result_info["execution_time"]
-        minutes = int(elapsed_time // 60)
-        seconds = elapsed_time % 60
+        whole_minutes, seconds = divmod(elapsed_time, 60)
+        minutes = int(whole_minutes)
 
         time_str = f"{minutes}m {seconds:.1f}s" if minutes > 0 else f"{seconds:.1f}s"
 
@@ -1516,6 +2021,8 @@ def save_results_to_json(
     output_file: str | None = None,
     benchmarks: list[str] | None = None,
     config: str | None = None,
+    embed_config: bool = True,
+    pretty: bool = False,
 ) -> str:
     """Save benchmark results to JSON file.
 
@@ -1524,36 +2031,46 @@ def save_results_to_json(
         output_file: Custom output file path (auto-generated if None)
         benchmarks: List of benchmarks that were run
         config: Configuration file used
+        embed_config: Embed the config contents in the JSON; if False, copy the config
+            next to the results file and record only its path
+        pretty: Indent the JSON for reading; compact output is smaller and faster to write
 
     Returns:
         Path to the generated JSON file
     """
+    # One clock read so the generated filename and the metadata timestamp agree
+    now = datetime.now()
+
     # Generate filename if not provided
     if output_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", now.timetuple())
         output_file = f"specer_results_{timestamp}.json"
+    output_path = Path(output_file)
 
     # Read config file contents if config path is provided
     config_data = None
-    if config and Path(config).exists():
+    if config:
+        # Fall back to just storing the path if the contents can't be read
+        config_data = {"path": config, "contents": ""}
         try:
-            with Path(config).open("r") as f:
-                config_data = {
-                    "path": config,
-                    "contents": f.read(),
-                }
+            if embed_config:
+                config_data["contents"] = Path(config).read_text()
+            else:
+                # Large configs are costly to escape into a JSON string; keep them as a sidecar file
+                sidecar_path = output_path.with_suffix(".config")
+                shutil.copyfile(config, sidecar_path)
+                config_data = {"path": config, "sidecar": str(sidecar_path)}
+        except FileNotFoundError:
+            # Config file doesn't exist (e.g., already cleaned up)
+            pass
         except OSError as e:
             logger.warning(f"Could not read config file {config}: {e}")
-            # Fallback to just storing the path
-            config_data = {"path": config, "contents": ""}
-    elif config:
-        # Config path provided but file doesn't exist (e.g., already cleaned up)
-        config_data = {"path": config, "contents": ""}
 
     # Prepare output data
     output_data = {
         "metadata": {
-            "timestamp": datetime.now().isoformat(),
+            # Serialized in ISO format by both encoders, see _json_default
+            "timestamp": now,
             "specer_version": "0.1.0",  # Could import from __version__ if needed
             "benchmarks": benchmarks or [],
             "config": config_data,
@@ -1561,9 +2078,56 @@ def save_results_to_json(
         "results": result_info,
     }
 
-    # Write to JSON file
-    output_path = Path(output_file)
-    with output_path.open("w") as f:
-        json.dump(output_data, f, indent=2, default=str)
+    # Serialize in one go (orjson is much faster for large result sets when installed)
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if pretty else orjson.OPT_NON_STR_KEYS
+        serialized = orjson.dumps(output_data, default=str, option=option)
+    else:
+        import json
+
+        # UTF-8 without escapes, like orjson, so both encoders write the same bytes
+        if pretty:
+            text = json.dumps(output_data, indent=2, ensure_ascii=False, default=_json_default)
+        else:
+            # Same separators as orjson's compact output
+            text = json.dumps(output_data, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+        serialized = text.encode()
+
+    # Go through a temporary file so a failed write never leaves a truncated results file
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(serialized)
+        tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     return str(output_path)
+
+
+def save_results_to_json_async(
+    result_info: dict[str, Any],
+    output_file: str | None = None,
+    benchmarks: list[str] | None = None,
+    config: str | None = None,
+    embed_config: bool = True,
+    pretty: bool = False,
+) -> Future[str]:
+    """Save benchmark results to JSON file on a background thread.
+
+    Takes the same arguments as save_results_to_json, so the caller can render
+    results while the file is serialized and written. result_info must not be
+    modified until the returned future completes.
+
+    Returns:
+        Future resolving to the path of the generated JSON file
+    """
+    return _SAVE_EXECUTOR.submit(
+        save_results_to_json, result_info, output_file, benchmarks, config, embed_config, pretty
+    )
+
+
+def _json_default(value: Any) -> str:
+    """Serialize values the stdlib encoder rejects the same way orjson would."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
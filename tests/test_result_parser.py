@@ -0,0 +1,104 @@
+"""Tests for SPEC result parsing."""
+
+from pathlib import Path
+
+from specer.result_parser import parse_result_files, read_result_file
+
+RUNCPU_OUTPUT = """\
+Running 505.mcf_r refrate base
+The log for this run is in /spec/result/CPU2017.001.log
+    format: Raw -> /spec/result/CPU2017.001.intrate.rsf
+The result of this run is in /spec/result/CPU2017.001.intrate.txt
+    format to /spec/result/CPU2017.001.intrate.pdf
+  Reports are in /spec/result/CPU2017.001.intrate.html
+Est. SPECrate2017_int_base = 12.5
+Est. SPECrate2017_int = 11
+Ignored word notes.TXT and /spec/result/CPU2017.001.intrate.txt again
+"""
+
+RSF_CONTENT = """\
+spec.cpu2017.basemean: 12.5
+spec.cpu2017.peakmean: --
+spec.cpu2017.results.505_mcf_r.base.000.ratio: 10.25
+spec.cpu2017.results.505_mcf_r.base.000.reported_sec: 157.6
+spec.cpu2017.results.505_mcf_r.base.000.reference: 1616
+spec.cpu2017.results.505_mcf_r.base.000.copies: 4
+spec.cpu2017.results.505_mcf_r.base.000.threads: 1
+spec.cpu2017.results.505_mcf_r.base.000.energy_ratio: 3.5
+spec.cpu2017.results.557_xz_r.base.000.RATIO: 8.5
+spec.cpu2017.results.557_xz_r.base.000.Reported_Sec: 127
+spec.cpu2017.errors000: 505.mcf_r (base) Run completed with a miscompare
+spec.cpu2017.errors001: 500.perlbench_r (base) Did not run
+"""
+
+
+class TestParseResultFiles:
+    """Test class for scanning runcpu output with the fused output pattern."""
+
+    def test_all_branches(self) -> None:
+        """Test that every kind of line is recognized in a single scan."""
+        result_info = parse_result_files(RUNCPU_OUTPUT)
+
+        assert result_info == {
+            "result_files": [
+                {"path": "/spec/result/CPU2017.001.intrate.rsf", "type": "result_file"},
+                {"path": "/spec/result/CPU2017.001.intrate.txt", "type": "result"},
+                {"path": "/spec/result/CPU2017.001.intrate.pdf", "type": "result"},
+                {"path": "/spec/result/CPU2017.001.intrate.html", "type": "result"},
+            ],
+            "scores": {"SPECrate2017_int_base": 12.5},
+            "metrics": {"SPECrate2017_int_base": 12.5, "SPECrate2017_int": 11.0},
+            "log_file": "/spec/result/CPU2017.001.log",
+        }
+
+    def test_extensions_match_case_sensitively(self) -> None:
+        """Test that file words need a lowercase result extension, as runcpu writes them."""
+        assert parse_result_files("see notes.TXT and CPU2017.002.fprate.ps") == {
+            "result_files": [{"path": "CPU2017.002.fprate.ps", "type": "result_file"}],
+            "scores": {},
+            "metrics": {},
+            "log_file": None,
+        }
+
+    def test_no_results(self) -> None:
+        """Test that output without files, scores or a log yields None."""
+        assert parse_result_files("Running 505.mcf_r\nError: build failed\n") is None
+
+
+class TestReadResultFile:
+    """Test class for parsing RSF result files."""
+
+    def test_detailed_fields(self, tmp_path: Path) -> None:
+        """Test that all detailed result fields are read by the one field alternation."""
+        rsf_path = tmp_path / "CPU2017.001.intrate.rsf"
+        rsf_path.write_text(RSF_CONTENT)
+
+        result_data = read_result_file(str(rsf_path), tmp_path)
+
+        assert result_data == {
+            "file_path": str(rsf_path),
+            "scores": {"SPECint2017_rate_base": 12.5},
+            "metrics": {},
+            "benchmark_results": {
+                "505.mcf_r": {
+                    "ratio": 10.25,
+                    "time": 157.6,
+                    "reference": 1616.0,
+                    "copies": 4,
+                    "threads": 1,
+                    "warning": "Run completed with a miscompare",
+                },
+                # Field names match case-insensitively
+                "557.xz_r": {"ratio": 8.5, "time": 127.0},
+            },
+        }
+
+    def test_relative_path_under_result_dir(self, tmp_path: Path) -> None:
+        """Test that a bare file name is looked up in the SPEC result directory."""
+        (tmp_path / "result").mkdir()
+        (tmp_path / "result" / "CPU2017.002.fpspeed.rsf").write_text("spec.cpu2017.basemean: 3.25\n")
+
+        result_data = read_result_file("CPU2017.002.fpspeed.rsf", tmp_path)
+
+        assert result_data is not None
+        assert result_data["scores"] == {"SPECfp2017_speed_base": 3.25}
@@ -0,0 +1,62 @@
+"""Tests for the run command."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from specer.cli import app
+
+
+class TestRunJsonOutput:
+    """Test class for the run command's --json output options."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def _run(self, tmp_path: Path, *options: str) -> dict:
+        """Run a stubbed benchmark with --json and return the saved document."""
+        config = tmp_path / "test.cfg"
+        config.write_text("tune = base\n")
+        output = tmp_path / "results.json"
+        result_info = {"success": True, "result_files": [], "scores": {"SPECrate2017_int_base": 1.0}}
+
+        with (
+            patch("specer.commands.run.validate_and_get_spec_root", return_value=str(tmp_path)),
+            patch("specer.commands.run.build_runcpu_command", return_value=["runcpu"]),
+            patch("specer.commands.run.execute_runcpu", return_value=result_info),
+        ):
+            result = self.runner.invoke(
+                app,
+                ["run", "505.mcf_r", "--config", str(config), "--json", str(output), "--parse-results", *options],
+            )
+
+        assert result.exit_code == 0, result.output
+        return json.loads(output.read_text())
+
+    def test_config_embedded_by_default(self, tmp_path: Path) -> None:
+        """Test that the config contents are embedded in the JSON output by default."""
+        config = self._run(tmp_path)["metadata"]["config"]
+
+        assert config == {"path": str(tmp_path / "test.cfg"), "contents": "tune = base\n"}
+        assert not (tmp_path / "results.config").exists()
+
+    def test_config_sidecar(self, tmp_path: Path) -> None:
+        """Test that --config-sidecar copies the config next to the JSON output instead."""
+        config = self._run(tmp_path, "--config-sidecar")["metadata"]["config"]
+
+        sidecar = tmp_path / "results.config"
+        assert config == {"path": str(tmp_path / "test.cfg"), "sidecar": str(sidecar)}
+        assert sidecar.read_text() == "tune = base\n"
+
+    @pytest.mark.parametrize(("options", "indented"), [((), False), (("--pretty",), True)])
+    def test_pretty(self, tmp_path: Path, options: tuple[str, ...], indented: bool) -> None:
+        """Test that --json is compact by default and --pretty restores indent=2."""
+        self._run(tmp_path, *options)
+        text = (tmp_path / "results.json").read_text()
+
+        assert text.startswith('{\n  "metadata": {\n    ') is indented
+        assert ("\n" in text) is indented
@@ -0,0 +1,71 @@
+"""Tests for the EvalSync integration."""
+
+import importlib.util
+
+import pytest
+
+from specer import sync
+from specer.sync import SpecerEvalSyncWorker, get_worker
+
+
+class TestSpecerEvalSyncWorker:
+    """Test class for SpecerEvalSyncWorker."""
+
+    def test_failed_connection_reraised_on_every_wait(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a background connection failure is reported to every waiter."""
+        monkeypatch.setenv("EVALSYNC_EXPERIMENT_ID", "experiment")
+
+        def fail_to_connect(self: SpecerEvalSyncWorker) -> None:
+            raise ConnectionError("manager unreachable")
+
+        monkeypatch.setattr(SpecerEvalSyncWorker, "initialize", fail_to_connect)
+        worker = SpecerEvalSyncWorker(refresh=True)
+        worker.initialize_async()
+
+        # The ready signal may be the first to observe the failure; later waits,
+        # such as the run command's connection check, must still see it
+        with pytest.raises(ConnectionError):
+            worker.ready()
+        with pytest.raises(ConnectionError):
+            worker.wait_initialized()
+
+        # Cleaning up after a failed connection is a no-op
+        worker.cleanup()
+
+    def test_cleanup_releases_singleton(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that get_worker() replaces a worker that has been cleaned up."""
+        monkeypatch.setenv("EVALSYNC_EXPERIMENT_ID", "experiment")
+        monkeypatch.setattr(sync, "_WORKER_SINGLETON", None)
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+        monkeypatch.setattr(SpecerEvalSyncWorker, "initialize", lambda self: None)
+
+        worker = get_worker()
+        assert get_worker() is worker
+
+        worker.cleanup()
+        assert sync._WORKER_SINGLETON is None
+        assert get_worker() is not worker
+
+    def test_ready_async_sent_after_connection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the background ready signal follows the background connection."""
+        monkeypatch.setenv("EVALSYNC_EXPERIMENT_ID", "experiment")
+        calls: list[str] = []
+
+        class FakeWorker:
+            def ready(self) -> None:
+                calls.append("ready")
+
+        def connect(self: SpecerEvalSyncWorker) -> None:
+            calls.append("initialize")
+            self.worker = FakeWorker()  # type: ignore[assignment]
+
+        monkeypatch.setattr(SpecerEvalSyncWorker, "initialize", connect)
+        worker = SpecerEvalSyncWorker(refresh=True)
+        worker.initialize_async()
+        worker.ready_async().result()
+
+        assert calls == ["initialize", "ready"]
@@ -0,0 +1,131 @@
+"""Tests for NUMA topology detection."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from specer import utils
+from specer.cli import app
+
+
+class TestParseCpulist:
+    """Test class for _parse_cpulist."""
+
+    @pytest.mark.parametrize(
+        ("cpulist", "expected"),
+        [
+            ("0-3", [0, 1, 2, 3]),
+            ("5", [5]),
+            ("0-1,4,6-7", [0, 1, 4, 6, 7]),
+            ("0-11,48-59\n", [*range(12), *range(48, 60)]),
+            ("3-3", [3]),
+        ],
+    )
+    def test_ranges_and_single_cpus(self, cpulist: str, expected: list[int]) -> None:
+        """Test that ranges and single CPUs expand in order."""
+        assert utils._parse_cpulist(cpulist) == expected
+
+    @pytest.mark.parametrize("cpulist", ["", "\n", "  ", ",", "\t\n"])
+    def test_empty_or_whitespace(self, cpulist: str) -> None:
+        """Test that empty and whitespace-only lists (e.g. a memory-only node) have no CPUs."""
+        assert utils._parse_cpulist(cpulist) == []
+
+    def test_invalid(self) -> None:
+        """Test that malformed lists raise ValueError, as sysfs readers expect."""
+        with pytest.raises(ValueError):
+            utils._parse_cpulist("0-a")
+
+
+class TestReadSysfsNumaTopology:
+    """Test class for reading the topology from sysfs."""
+
+    def test_reads_nodes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that node directories are read in node order, including CPU-less nodes."""
+        for node, cpulist in (("node1", "4-7\n"), ("node0", "0-3\n"), ("node2", "\n")):
+            (tmp_path / node).mkdir()
+            (tmp_path / node / "cpulist").write_text(cpulist)
+        (tmp_path / "possible").write_text("0-2\n")
+        monkeypatch.setattr(utils, "_SYSFS_NODE_DIR", tmp_path)
+
+        assert utils._read_sysfs_numa_topology() == {
+            "nodes": [0, 1, 2],
+            "node_cpus": {0: [0, 1, 2, 3], 1: [4, 5, 6, 7], 2: []},
+            "total_cpus": 8,
+        }
+
+    def test_missing_sysfs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a kernel without node directories falls back to numactl."""
+        monkeypatch.setattr(utils, "_SYSFS_NODE_DIR", tmp_path / "missing")
+
+        assert utils._read_sysfs_numa_topology() is None
+
+
+class TestTopologyCache:
+    """Test class for the on-disk NUMA topology cache."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Point the cache and its invalidation sources at temporary files and count detections."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        self.sources = {name: tmp_path / name for name in ("boot_id", "cpu_online", "node_online")}
+        self.sources["boot_id"].write_text("4f1c0e0a-boot-1\n")
+        self.sources["cpu_online"].write_text("0-7\n")
+        self.sources["node_online"].write_text("0-1\n")
+        monkeypatch.setattr(utils, "_TOPOLOGY_CACHE_SOURCES", tuple(self.sources.values()))
+
+        self.detections = 0
+
+        def detect() -> dict[str, Any]:
+            self.detections += 1
+            return {"nodes": [0, 1], "node_cpus": {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}, "total_cpus": 8}
+
+        monkeypatch.setattr(utils, "_detect_numa_topology", detect)
+        utils._invalidate_detections()
+        yield
+        utils._invalidate_detections()
+
+    def _new_process(self) -> dict[str, Any] | None:
+        """Look the topology up again as a fresh invocation would, past the in-process cache."""
+        utils._invalidate_detections()
+        return utils.validate_numa_topology()
+
+    def test_reused_from_disk(self) -> None:
+        """Test that a later invocation reads the cached topology instead of detecting it."""
+        first = utils.validate_numa_topology()
+        second = self._new_process()
+
+        assert self.detections == 1
+        assert second == first
+        assert second is not None and second["node_cpus"][1] == [4, 5, 6, 7]
+
+    @pytest.mark.parametrize(
+        ("source", "contents"),
+        [("boot_id", "9b2d7c11-boot-2\n"), ("cpu_online", "0-3\n"), ("node_online", "0\n")],
+    )
+    def test_invalidated_by_boot_or_hotplug(self, source: str, contents: str) -> None:
+        """Test that a reboot or a CPU/node online-mask change triggers detection again."""
+        utils.validate_numa_topology()
+        self.sources[source].write_text(contents)
+        self._new_process()
+
+        assert self.detections == 2
+
+    def test_refresh_topology_option(self) -> None:
+        """Test that topology --refresh-topology detects again despite a valid cache."""
+        runner = CliRunner()
+        utils.validate_numa_topology()
+
+        result = runner.invoke(app, ["topology"])
+        assert result.exit_code == 0, result.output
+        assert self.detections == 1
+
+        result = runner.invoke(app, ["topology", "--refresh-topology"])
+        assert result.exit_code == 0, result.output
+        assert self.detections == 2
+
+        # The refreshed topology is cached again for later invocations
+        self._new_process()
+        assert self.detections == 2
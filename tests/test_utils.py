@@ -0,0 +1,268 @@
+"""Tests for specer.utils helpers."""
+
+import json
+import os
+import pty
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from specer import utils
+
+GCC_GE_10_LINE = "#%define GCCge10  # EDIT: remove the '#' from column 1 if using GCC 10 or later"
+TEMPLATE = (
+    f"{GCC_GE_10_LINE}\n"
+    '%   define label "mytest"           # (2)      Use a label meaningful to *you*.\n'
+    f"{utils._GCC_DIR_LINE}\n"
+)
+
+
+@pytest.fixture
+def spec_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a minimal SPEC installation and an isolated specer cache."""
+    root = tmp_path / "spec"
+    (root / "config").mkdir(parents=True)
+    (root / "config" / "Example-gcc-linux-x86.cfg").write_text(TEMPLATE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return root
+
+
+class TestConfigCache:
+    """Test class for the generated config cache."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_detections(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Start without memoized detections and count how often the template is rendered."""
+        utils._invalidate_detections()
+        self.renders = 0
+        apply_template_edits = utils._apply_template_edits
+
+        def counting_apply_template_edits(template_content: str, edits: dict[str, str]) -> str:
+            self.renders += 1
+            return apply_template_edits(template_content, edits)
+
+        monkeypatch.setattr(utils, "_apply_template_edits", counting_apply_template_edits)
+        yield
+        utils._invalidate_detections()
+
+    @staticmethod
+    def _generate(monkeypatch: pytest.MonkeyPatch, spec_root: Path, gcc_dir: str, gcc_version: int = 11) -> str:
+        """Generate a GCC config on a system whose GCC is gcc_version installed in gcc_dir."""
+        monkeypatch.setattr(utils, "detect_gcc_path", lambda: gcc_dir)
+        monkeypatch.setattr(utils, "detect_gcc_version", lambda: gcc_version)
+        config_path = utils.generate_config_from_template(cores=4, spec_root=spec_root, compiler="gcc")
+        assert config_path is not None
+        return config_path
+
+    def test_cache_hit_skips_rendering(self, monkeypatch: pytest.MonkeyPatch, spec_root: Path) -> None:
+        """Test that identical inputs and detections reuse the cached config."""
+        first = self._generate(monkeypatch, spec_root, "/opt/gcc-a")
+        second = self._generate(monkeypatch, spec_root, "/opt/gcc-a")
+
+        assert second == first
+        assert self.renders == 1
+
+    def test_cache_miss_on_gcc_upgrade(self, monkeypatch: pytest.MonkeyPatch, spec_root: Path) -> None:
+        """Test that upgrading GCC in place renders the config again with the GCCge10 define."""
+        old_config = self._generate(monkeypatch, spec_root, "/usr", gcc_version=9)
+        assert "\n%define GCCge10" not in "\n" + Path(old_config).read_text()
+
+        new_config = self._generate(monkeypatch, spec_root, "/usr", gcc_version=11)
+
+        assert self.renders == 2
+        assert "\n%define GCCge10" in "\n" + Path(new_config).read_text()
+
+    def test_file_name_stable_across_environments(self, monkeypatch: pytest.MonkeyPatch, spec_root: Path) -> None:
+        """Test that the config file name depends only on the parameters, not the detections."""
+        config_a = self._generate(monkeypatch, spec_root, "/opt/gcc-a")
+        config_b = self._generate(monkeypatch, spec_root, "/opt/gcc-b")
+
+        assert config_b == config_a
+        assert [path.name for path in (spec_root / "config" / "specer").iterdir()] == [Path(config_a).name]
+
+    def test_overwritten_config_not_served(self, monkeypatch: pytest.MonkeyPatch, spec_root: Path) -> None:
+        """Test that a cache entry whose file another environment rewrote is a miss."""
+        config_a = self._generate(monkeypatch, spec_root, "/opt/gcc-a")
+        self._generate(monkeypatch, spec_root, "/opt/gcc-b")
+        self._generate(monkeypatch, spec_root, "/opt/gcc-a")
+
+        assert self.renders == 3
+        content = Path(config_a).read_text()
+        assert '"/opt/gcc-a"' in content
+        assert '"/opt/gcc-b"' not in content
+
+    def test_spec_checksums_kept(self, monkeypatch: pytest.MonkeyPatch, spec_root: Path) -> None:
+        """Test that a config SPEC has written checksums into is reused, not regenerated."""
+        config_path = Path(self._generate(monkeypatch, spec_root, "/opt/gcc-a"))
+        with config_path.open("a") as f:
+            f.write("__HASH__\n505.mcf_r=base=specer:\nexehash=0123abcd\n")
+        compiled = config_path.read_text()
+
+        assert self._generate(monkeypatch, spec_root, "/opt/gcc-a") == str(config_path)
+        assert config_path.read_text() == compiled
+        # The entry now records the compiled config, so the next run is a hit again
+        assert self._generate(monkeypatch, spec_root, "/opt/gcc-a") == str(config_path)
+        assert self.renders == 2
+
+
+class TestIsValidCpuList:
+    """Test class for --cpu-cores validation."""
+
+    @pytest.mark.parametrize("cpu_cores", ["0", "0-3", "0,2,4,6", "0-3,8-11", "0, 2"])
+    def test_valid(self, cpu_cores: str) -> None:
+        """Test that CPU numbers, ranges and lists are accepted."""
+        assert utils.is_valid_cpu_list(cpu_cores)
+
+    @pytest.mark.parametrize("cpu_cores", ["", "a", "0-3;4", "all", "0x1"])
+    def test_invalid(self, cpu_cores: str) -> None:
+        """Test that anything else is rejected."""
+        assert not utils.is_valid_cpu_list(cpu_cores)
+
+
+class TestSaveResultsToJson:
+    """Test class for save_results_to_json."""
+
+    RESULT_INFO = {
+        "success": True,
+        "scores": {"SPECrate2017_int_base": 12.5},
+        "benchmark_results": {
+            "505.mcf_r": {"ratio": 10.25, "time": 157.0, "copies": 4, "status": "success"},
+            "520.omnetpp_r": {"status": "failed", "ratio": None},
+        },
+        "result_files": [{"path": "/spec/result/CPU2017.001.intrate.rsf", "type": "rsf"}],
+        "log_file": "/spec/result/CPU2017.001.log",
+        "note": "µarch ✓",
+    }
+
+    def _save(self, monkeypatch: pytest.MonkeyPatch, path: Path, use_orjson: bool, pretty: bool) -> bytes:
+        """Save RESULT_INFO with the chosen encoder and return the bytes, timestamp masked."""
+        monkeypatch.setattr(utils, "HAS_ORJSON", use_orjson)
+        utils.save_results_to_json(self.RESULT_INFO, str(path), ["505.mcf_r", "520.omnetpp_r"], pretty=pretty)
+        written = path.read_bytes()
+        # The timestamp is the only field that differs between two saves
+        assert re.search(rb'"timestamp": ?"\d{4}-\d\d-\d\dT[\d:.]+"', written)
+        return re.sub(rb'("timestamp": ?)"[^"]*"', rb'\1"<now>"', written)
+
+    @pytest.mark.skipif(not utils.HAS_ORJSON, reason="orjson not installed")
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_encoders_write_identical_bytes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, pretty: bool
+    ) -> None:
+        """Test that orjson and the stdlib fallback produce the same file."""
+        with_orjson = self._save(monkeypatch, tmp_path / "orjson.json", True, pretty)
+        with_stdlib = self._save(monkeypatch, tmp_path / "stdlib.json", False, pretty)
+
+        assert with_orjson == with_stdlib
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_output_layout(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, pretty: bool) -> None:
+        """Test that output is compact by default and indented by two spaces when pretty."""
+        written = self._save(monkeypatch, tmp_path / "results.json", utils.HAS_ORJSON, pretty).decode()
+
+        document = json.loads(written)
+        assert document["results"] == self.RESULT_INFO
+        if pretty:
+            assert written == json.dumps(document, indent=2, ensure_ascii=False)
+        else:
+            assert written == json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+
+    def test_failed_write_keeps_previous_file(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that a failed write leaves the previous results intact and no temporary file behind."""
+        path = tmp_path / "results.json"
+        path.write_text("previous")
+
+        write_bytes = Path.write_bytes
+
+        def fail_to_write(self: Path, data: bytes) -> int:
+            write_bytes(self, data[:10])
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "write_bytes", fail_to_write)
+        with pytest.raises(OSError, match="disk full"):
+            utils.save_results_to_json(self.RESULT_INFO, str(path))
+
+        assert path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestIterOutputLines:
+    """Test class for iter_output_lines."""
+
+    @staticmethod
+    def _pipe(data: bytes) -> int:
+        """Return the read end of a closed pipe holding data."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+        return read_fd
+
+    def test_batches_complete_lines(self) -> None:
+        """Test that lines completed by one read are yielded together, with the tail last."""
+        fd = self._pipe(b"one\ntwo\r\nthree")
+        try:
+            assert list(utils.iter_output_lines(fd)) == [["one", "two"], ["three"]]
+        finally:
+            os.close(fd)
+
+    def test_lines_split_across_reads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a line spanning several reads is joined before it is yielded."""
+        monkeypatch.setattr(utils, "_OUTPUT_CHUNK_SIZE", 4)
+        fd = self._pipe(b"abcdefgh\nij\n")
+        try:
+            lines = [line for batch in utils.iter_output_lines(fd) for line in batch]
+        finally:
+            os.close(fd)
+        assert lines == ["abcdefgh", "ij"]
+
+    def test_invalid_utf8_replaced(self) -> None:
+        """Test that undecodable bytes do not abort reading."""
+        fd = self._pipe(b"ok\n\xff\xfe\n")
+        try:
+            assert list(utils.iter_output_lines(fd)) == [["ok", "\ufffd\ufffd"]]
+        finally:
+            os.close(fd)
+
+    def test_pty_closed_by_child(self) -> None:
+        """Test that the EIO a pty master reports after the child side closes ends the output."""
+        master_fd, slave_fd = pty.openpty()
+        os.write(slave_fd, b"done\n")
+        os.close(slave_fd)
+        try:
+            assert list(utils.iter_output_lines(master_fd)) == [["done"]]
+        finally:
+            os.close(master_fd)
+
+
+class TestApplyTemplateEdits:
+    """Test class for _apply_template_edits."""
+
+    def test_replaces_every_occurrence(self) -> None:
+        """Test that ordinary edits replace each occurrence in one pass."""
+        template = "tune = base\ncopies = 1\ntune = base\n"
+        edits = {"tune = base": "tune = peak", "copies = 1": "copies = 8"}
+
+        assert utils._apply_template_edits(template, edits) == "tune = peak\ncopies = 8\ntune = peak\n"
+
+    def test_gcc_dir_first_occurrence_only(self) -> None:
+        """Test that only the main gcc_dir define is edited, not the conditional copy."""
+        template = f"%if %{{bits}} == 64\n{utils._GCC_DIR_LINE}\n%else\n{utils._GCC_DIR_LINE}\n%endif\n"
+        new_line = '%   define  gcc_dir        "/usr"  # EDIT (see above) (auto-detected)'
+
+        edited = utils._apply_template_edits(template, {utils._GCC_DIR_LINE: new_line})
+
+        assert edited == f"%if %{{bits}} == 64\n{new_line}\n%else\n{utils._GCC_DIR_LINE}\n%endif\n"
+
+    def test_replacements_not_rescanned(self) -> None:
+        """Test that text produced by one edit is not matched by another."""
+        edits = {"a = 1": "b = 2", "b = 2": "c = 3"}
+
+        assert utils._apply_template_edits("a = 1\nb = 2\n", edits) == "b = 2\nc = 3\n"
+
+    def test_special_characters_and_no_edits(self) -> None:
+        """Test that edits match literally and an empty edit set leaves the text alone."""
+        template = "OPTIMIZE = -O2 (x|y).*\n"
+
+        assert utils._apply_template_edits(template, {"(x|y).*": "[z]"}) == "OPTIMIZE = -O2 [z]\n"
+        assert utils._apply_template_edits(template, {}) is template